@@ -267,6 +267,9 @@ def create_parser() -> argparse.ArgumentParser:
         default="table",
         help="Output format",
     )
+    pod_list.add_argument(
+        "--limit", type=int, default=None, help="Show at most N pods"
+    )
 
     # pod ps (list containers in pod)
     pod_ps = pod_subparsers.add_parser("ps", help="List containers in pod")
@@ -905,7 +908,7 @@ def cmd_pod(args: argparse.Namespace) -> int:
             return 1
 
     elif args.pod_command == "ls":
-        pod_list = pods.list()
+        pod_list = pods.list(limit=getattr(args, "limit", None))
 
         if getattr(args, "quiet", False):
             for p in pod_list:
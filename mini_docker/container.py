@@ -15,8 +15,10 @@ Container Lifecycle:
 """
 
 import errno
+import fcntl
 import json
 import os
+import select
 import signal
 import sys
 import time
@@ -24,11 +26,12 @@ from dataclasses import asdict
 from typing import Dict, List, Optional
 
 from mini_docker.capabilities import Capabilities
-from mini_docker.cgroups import Cgroup, delete_cgroup
+from mini_docker.cgroups import MINI_DOCKER_CGROUP, Cgroup, delete_cgroup
 from mini_docker.filesystem import (
     MS_BIND,
     MS_RDONLY,
     MS_REC,
+    FilesystemError,
     cleanup_overlay,
     mount,
     setup_chroot_filesystem,
@@ -36,21 +39,31 @@ from mini_docker.filesystem import (
     setup_overlay_filesystem,
     setup_pivot_root,
 )
-from mini_docker.logger import ContainerLogger
+from mini_docker.logger import ContainerLogger, print_logs
 from mini_docker.metadata import (
     ContainerConfig,
     MetadataStore,
+    ResourceLimits,
+    delete_container_config,
     get_container_path,
     load_container_config,
     save_container_config,
     update_container_status,
 )
 from mini_docker.namespaces import (
+    NamespaceError,
     create_namespaces,
     enter_all_namespaces,
+    enter_namespaces_pidfd,
     setup_user_namespace,
 )
-from mini_docker.network import Network, configure_container_network, parse_port_mapping
+from mini_docker.network import (
+    Network,
+    configure_container_network,
+    parse_port_mapping,
+    remove_port_forwarding,
+    setup_port_forwarding,
+)
 from mini_docker.pod import PodManager, load_pod_config
 from mini_docker.seccomp import Seccomp
 from mini_docker.utils import check_root, ensure_directories, get_overlay_paths
@@ -98,8 +111,6 @@ def _open_container_metadata_fd(container_id: str) -> int:
 
 def _write_config_to_fd(fd: int, config: ContainerConfig) -> None:
     """Persist container metadata through a pre-opened host-side file descriptor."""
-    import fcntl
-
     payload = json.dumps(asdict(config), indent=2).encode("utf-8")
     try:
         fcntl.flock(fd, fcntl.LOCK_EX)
@@ -113,6 +124,19 @@ def _write_config_to_fd(fd: int, config: ContainerConfig) -> None:
             pass
 
 
+def _config_overlay_paths(config: ContainerConfig) -> Optional[tuple]:
+    """Return the overlay paths recorded at create time, if all are set."""
+    paths = (
+        config.overlay_lower,
+        config.overlay_upper,
+        config.overlay_work,
+        config.overlay_merged,
+    )
+    if all(paths):
+        return paths
+    return None
+
+
 def _try_reap_process(pid: int) -> Optional[int]:
     """Return a process exit code if this process can reap pid, otherwise None."""
     try:
@@ -129,6 +153,58 @@ def _try_reap_process(pid: int) -> Optional[int]:
     return _exit_code_from_wait_status(status)
 
 
+def _wait_for_exit(pid: int, timeout: float) -> Optional[int]:
+    """
+    Wait up to ``timeout`` seconds for a process to exit.
+
+    Prefers pidfd readiness: a single poll that wakes up when the process
+    exits, instead of repeated os.kill(pid, 0) signal probes that each take
+    the kernel task lock. Falls back to /proc polling where pidfds are
+    unavailable.
+
+    Returns:
+        The exit code (0 when the process cannot be reaped from here),
+        or None if it is still running after the timeout.
+    """
+    exit_code = _try_reap_process(pid)
+    if exit_code is not None:
+        return exit_code
+
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is not None:
+        try:
+            pidfd = pidfd_open(pid, 0)
+        except ProcessLookupError:
+            return 0
+        except OSError:
+            pidfd = None
+
+        if pidfd is not None:
+            try:
+                ready, _, _ = select.select([pidfd], [], [], timeout)
+            except (OSError, ValueError):
+                ready = []
+            finally:
+                os.close(pidfd)
+
+            if not ready:
+                return None
+            exit_code = _try_reap_process(pid)
+            return exit_code if exit_code is not None else 0
+
+    # Fallback: poll /proc for process exit (vfs lookup, no task lock).
+    deadline = time.monotonic() + timeout
+    while True:
+        exit_code = _try_reap_process(pid)
+        if exit_code is not None:
+            return exit_code
+        if not os.path.exists(f"/proc/{pid}"):
+            return 0
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(0.1)
+
+
 class Container:
     """
     Container manager class.
@@ -201,8 +277,6 @@ class Container:
             raise ContainerInvalidRequestError(f"Rootfs not found: {rootfs}")
 
         # Create configuration
-        from mini_docker.metadata import ResourceLimits
-
         pod = load_pod_config(pod_id) if pod_id else None
         if pod_id and not pod:
             raise ContainerNotFoundError(f"Pod not found: {pod_id}")
@@ -380,17 +454,12 @@ class Container:
                     network = Network(config.id)
                     veth_host, veth_container, ip = network.setup(pid)
 
-                    config = load_container_config(container_id)
-                    if config:
-                        config.network.ip = ip
-                        config.network.veth_host = veth_host
-                        config.network.veth_container = veth_container
-                        save_container_config(config)
+                    config.network.ip = ip
+                    config.network.veth_host = veth_host
+                    config.network.veth_container = veth_container
 
                     # Setup port forwarding
-                    if config and config.network.ports:
-                        from mini_docker.network import setup_port_forwarding
-
+                    if config.network.ports:
                         for port_mapping in config.network.ports:
                             host_port, container_port = parse_port_mapping(port_mapping)
                             setup_port_forwarding(host_port, container_port, ip)
@@ -404,8 +473,6 @@ class Container:
                         f"Warning: Optional network setup failed: {e}", file=sys.stderr
                     )
                 else:
-                    from mini_docker.network import remove_port_forwarding
-
                     for (
                         host_port,
                         container_port,
@@ -437,15 +504,22 @@ class Container:
                     os.close(c2p_r)
                     raise ContainerError(f"Network setup failed: {e}") from e
 
+            # Persist running state and network assignments in a single
+            # write, before signaling the child so its config reload sees
+            # the final state.
+            config.status = "running"
+            config.pid = pid
+            config.supervisor_pid = pid
+            if config.started_at is None:
+                config.started_at = time.time()
+            save_container_config(config)
+
             # Signal child to proceed
             try:
                 os.write(p2c_w, b"X")
             except OSError:
                 pass
 
-            # Update status
-            update_container_status(container_id, "running", pid=pid)
-
             if config.pod_id:
                 self.pods.add_container(config.pod_id, config.id)
 
@@ -468,10 +542,6 @@ class Container:
         """
         # We must make sure the container directory exists before setting up the logger.
         # This is because the logger tries to open a file inside this directory immediately.
-        import os
-
-        from mini_docker.metadata import get_container_path
-
         os.makedirs(get_container_path(config.id), exist_ok=True)
 
         # Set up logging
@@ -622,11 +692,9 @@ class Container:
 
             if config.use_overlay:
                 try:
-                    from mini_docker.filesystem import FilesystemError
-
                     # Set up overlay filesystem
                     lower, upper, work, merged = setup_overlay_filesystem(
-                        config.rootfs, config.id
+                        config.rootfs, config.id, paths=_config_overlay_paths(config)
                     )
                     rootfs_to_pivot = merged
                     config.overlay_merged = merged
@@ -913,6 +981,12 @@ class Container:
         if not config:
             raise ContainerNotFoundError(f"Container not found: {container_id}")
 
+        return self._stop_config(config, timeout=timeout)
+
+    def _stop_config(self, config: ContainerConfig, timeout: int = 10) -> bool:
+        """Stop a container whose config the caller already holds."""
+        container_id = config.id
+
         if config.status != "running":
             raise ContainerInvalidStateError(f"Container not running: {container_id}")
 
@@ -920,9 +994,9 @@ class Container:
             return self._finalize_stopped_container(container_id, config)
 
         try:
-            # Check if process exists before sending signal
+            # Send SIGTERM; ESRCH means the process is already gone.
             try:
-                os.kill(config.pid, 0)  # Check if process exists
+                os.kill(config.pid, signal.SIGTERM)
             except OSError as e:
                 if e.errno == errno.ESRCH:  # No such process
                     return self._finalize_stopped_container(
@@ -930,28 +1004,8 @@ class Container:
                     )
                 raise
 
-            # Send SIGTERM
-            os.kill(config.pid, signal.SIGTERM)
-
-            # Wait for process to exit. Reap direct children during the grace
-            # window; kill(pid, 0) remains true for zombies.
-            import time
-
-            exit_code = None
-            for _ in range(max(timeout, 0) * 10):
-                exit_code = _try_reap_process(config.pid)
-                if exit_code is not None:
-                    break
-
-                try:
-                    os.kill(config.pid, 0)
-                except OSError as e:
-                    if e.errno == errno.ESRCH:
-                        exit_code = 0
-                        break
-                    raise
-
-                time.sleep(0.1)
+            # Wait for the process to exit during the grace window.
+            exit_code = _wait_for_exit(config.pid, max(timeout, 0))
 
             if exit_code is None:
                 # Process still running, send SIGKILL
@@ -962,12 +1016,8 @@ class Container:
                         raise
                     exit_code = 0
 
-                for _ in range(10):
-                    reaped_exit_code = _try_reap_process(config.pid)
-                    if reaped_exit_code is not None:
-                        exit_code = reaped_exit_code
-                        break
-                    time.sleep(0.1)
+                if exit_code is None:
+                    exit_code = _wait_for_exit(config.pid, 1.0)
 
                 if exit_code is None:
                     exit_code = 128 + signal.SIGKILL
@@ -1003,7 +1053,7 @@ class Container:
 
         if config.status == "running":
             if force:
-                self.stop(container_id, timeout=5)
+                self._stop_config(config, timeout=5)
             else:
                 raise ContainerInvalidStateError(
                     f"Container is running. Stop first or use force=True"
@@ -1015,7 +1065,7 @@ class Container:
         # Clean up overlay
         if config.use_overlay:
             try:
-                cleanup_overlay(config.id)
+                cleanup_overlay(config.id, paths=_config_overlay_paths(config))
             except Exception as e:
                 errors.append(f"Overlay cleanup: {e}")
 
@@ -1035,8 +1085,6 @@ class Container:
             pass
 
         # Delete metadata
-        from mini_docker.metadata import delete_container_config
-
         result = delete_container_config(container_id)
 
         # Log any errors but don't fail
@@ -1086,8 +1134,13 @@ class Container:
         if pid == 0:
             # Child - enter container namespaces and exec
             try:
-                # Enter all container namespaces
-                enter_all_namespaces(config.pid)
+                # Enter all container namespaces. Prefer the single-setns
+                # pidfd path; fall back to per-namespace entry on older
+                # kernels.
+                try:
+                    enter_namespaces_pidfd(config.pid)
+                except NamespaceError:
+                    enter_all_namespaces(config.pid)
 
                 # Change to container root
                 if config.use_overlay and config.overlay_merged:
@@ -1150,8 +1203,6 @@ class Container:
             tail: Number of lines from end
             timestamps: Show timestamps
         """
-        from mini_docker.logger import print_logs
-
         config = load_container_config(container_id)
         if not config:
             raise ContainerNotFoundError(f"Container not found: {container_id}")
@@ -1197,8 +1248,6 @@ class Container:
 
         if config.network.ports and config.network.ip:
             try:
-                from mini_docker.network import remove_port_forwarding
-
                 for port_mapping in config.network.ports:
                     host_port, container_port = parse_port_mapping(port_mapping)
                     remove_port_forwarding(host_port, container_port, config.network.ip)
@@ -1209,13 +1258,15 @@ class Container:
             try:
                 network = Network(config.id)
                 network.veth_host = config.network.veth_host
+                # cleanup only returns the address to the in-process
+                # bitmap when it knows it; without this a long-running
+                # daemon leaks one /24 address per container start
+                network.ip_address = config.network.ip
                 network.cleanup()
             except Exception as e:
                 errors.append(f"Network cleanup: {e}")
 
         if not config.rootless:
-            from mini_docker.cgroups import MINI_DOCKER_CGROUP
-
             cgroup_path = os.path.join(MINI_DOCKER_CGROUP, config.id)
             try:
                 delete_cgroup(cgroup_path)
@@ -22,7 +22,7 @@ from mini_docker.container import (
     ContainerInvalidStateError,
     ContainerNotFoundError,
 )
-from mini_docker.metadata import ContainerLookupAmbiguityError, asdict
+from mini_docker.metadata import ContainerLookupAmbiguityError, _config_to_dict
 from mini_docker.utils import DEFAULT_SOCKET_PATH, ensure_directories
 
 if hasattr(socketserver, "ThreadingUnixStreamServer"):
@@ -101,7 +101,7 @@ class DockerAPIHandler(BaseHTTPRequestHandler):
         if path == "/containers/json":
             # List containers
             containers = self.container_manager.list(all_containers=True)
-            self.send_json_response(200, [asdict(c) for c in containers])
+            self.send_json_response(200, [_config_to_dict(c) for c in containers])
             return
 
         elif path.startswith("/containers/") and path.endswith("/json"):
@@ -110,7 +110,7 @@ class DockerAPIHandler(BaseHTTPRequestHandler):
             try:
                 config = self.container_manager.inspect(container_id)
                 if config:
-                    self.send_json_response(200, asdict(config))
+                    self.send_json_response(200, _config_to_dict(config))
                 else:
                     self.send_error_response(404, "Container not found")
             except ContainerLookupAmbiguityError as e:
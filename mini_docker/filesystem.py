@@ -20,9 +20,11 @@ System Calls Used:
 """
 
 import ctypes
+import fcntl
 import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 
 from mini_docker.utils import get_overlay_paths, libc
@@ -54,6 +56,50 @@ MNT_DETACH = 2
 MNT_EXPIRE = 4
 UMOUNT_NOFOLLOW = 8
 
+# ioctl(FICLONE) from <linux/fs.h> - zero-copy reflink on btrfs/XFS
+FICLONE = 0x40049409
+
+# Declaring prototypes once lets ctypes skip per-call type coercion
+libc.mount.argtypes = [
+    ctypes.c_char_p,
+    ctypes.c_char_p,
+    ctypes.c_char_p,
+    ctypes.c_ulong,
+    ctypes.c_char_p,
+]
+libc.mount.restype = ctypes.c_int
+libc.umount2.argtypes = [ctypes.c_char_p, ctypes.c_int]
+libc.umount2.restype = ctypes.c_int
+libc.chroot.argtypes = [ctypes.c_char_p]
+libc.chroot.restype = ctypes.c_int
+
+# pivot_root has no libc wrapper; bind syscall(2) with fixed argtypes so
+# ctypes passes the bytes straight through without per-call c_char_p
+# wrappers. Indexing the CDLL yields a fresh function object, keeping
+# the prototype off other libc.syscall users.
+SYS_pivot_root = 155  # x86_64 syscall number
+_pivot_root_syscall = libc["syscall"]
+_pivot_root_syscall.argtypes = [ctypes.c_long, ctypes.c_char_p, ctypes.c_char_p]
+_pivot_root_syscall.restype = ctypes.c_long
+
+# Pre-encoded strings for the fixed mounts every container performs
+_B_PROC = b"proc"
+_B_SYSFS = b"sysfs"
+_B_DEVTMPFS = b"devtmpfs"
+_B_DEVPTS = b"devpts"
+_B_DEV = b"/dev"
+_B_OVERLAY = b"overlay"
+
+# Static minimal /dev table, precomputed: (name, mode with S_IFCHR, devnum)
+_MIN_DEV_NODES = [
+    ("null", 0o020666, os.makedev(1, 3)),
+    ("zero", 0o020666, os.makedev(1, 5)),
+    ("random", 0o020666, os.makedev(1, 8)),
+    ("urandom", 0o020666, os.makedev(1, 9)),
+    ("tty", 0o020666, os.makedev(5, 0)),
+    ("console", 0o020620, os.makedev(5, 1)),
+]
+
 
 class FilesystemError(Exception):
     """Exception raised for filesystem operations."""
@@ -61,6 +107,170 @@ class FilesystemError(Exception):
     pass
 
 
+def clone_file(src_path: str, dst_path: str) -> None:
+    """
+    Copy one regular file, preferring zero-copy clone paths.
+
+    Tries ioctl(FICLONE) for an instant reflink, then copy_file_range(2)
+    for an in-kernel copy, and falls back to shutil.copy2 last.
+
+    Args:
+        src_path: Source file
+        dst_path: Destination file path (overwritten if present)
+    """
+    src_fd = os.open(src_path, os.O_RDONLY)
+    try:
+        st = os.fstat(src_fd)
+        dst_fd = os.open(
+            dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, st.st_mode & 0o7777
+        )
+        try:
+            # Reflink: an instant COW clone with no data copy at all
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                shutil.copystat(src_path, dst_path)
+                return
+            except OSError:
+                pass
+
+            # In-kernel copy: no userspace read/write round-trips
+            copy_file_range = getattr(os, "copy_file_range", None)
+            if copy_file_range is not None:
+                try:
+                    remaining = st.st_size
+                    while remaining > 0:
+                        copied = copy_file_range(src_fd, dst_fd, remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    if remaining == 0:
+                        shutil.copystat(src_path, dst_path)
+                        return
+                except OSError:
+                    pass
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    # Last resort: plain userspace copy
+    shutil.copy2(src_path, dst_path)
+
+
+def clone_tree(src: str, dst: str) -> None:
+    """
+    Recursively copy ``src`` into ``dst``, preferring zero-copy clones.
+
+    Behaves like shutil.copytree(dirs_exist_ok=True, symlinks=True) but
+    clones regular files with ioctl(FICLONE) where the filesystem
+    supports reflinks, then copy_file_range(2), and only falls back to a
+    userspace copy as a last resort.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (created if missing)
+    """
+    os.makedirs(dst, exist_ok=True)
+
+    with os.scandir(src) as entries:
+        for entry in entries:
+            dst_path = os.path.join(dst, entry.name)
+            if entry.is_symlink():
+                target = os.readlink(entry.path)
+                try:
+                    os.symlink(target, dst_path)
+                except FileExistsError:
+                    os.remove(dst_path)
+                    os.symlink(target, dst_path)
+            elif entry.is_dir(follow_symlinks=False):
+                clone_tree(entry.path, dst_path)
+            elif entry.is_file(follow_symlinks=False):
+                clone_file(entry.path, dst_path)
+            # Device nodes and sockets are skipped; containers recreate
+            # them via setup_minimal_dev
+
+    try:
+        shutil.copystat(src, dst)
+    except OSError:
+        pass
+
+
+def _rmtree_fd(fd: int) -> None:
+    """Unlink everything under an open directory fd, depth-first."""
+    with os.scandir(fd) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                child_fd = os.open(
+                    entry.name, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW, dir_fd=fd
+                )
+                try:
+                    _rmtree_fd(child_fd)
+                finally:
+                    os.close(child_fd)
+                os.rmdir(entry.name, dir_fd=fd)
+            else:
+                os.unlink(entry.name, dir_fd=fd)
+
+
+def fast_rmtree(path: str) -> None:
+    """
+    Remove a directory tree using fd-relative unlinks.
+
+    shutil.rmtree resolves the full pathname for every entry it removes;
+    walking with openat/unlinkat via dir_fd keeps each operation relative
+    to an already-open directory, which is markedly cheaper on deep
+    trees like container rootfs copies.
+
+    Args:
+        path: Directory tree to remove
+
+    Raises:
+        OSError: If removal fails
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW)
+    try:
+        _rmtree_fd(fd)
+    finally:
+        os.close(fd)
+    os.rmdir(path)
+
+
+def mount_raw(
+    source: Optional[bytes],
+    target: bytes,
+    fstype: Optional[bytes] = None,
+    flags: int = 0,
+    options: Optional[bytes] = None,
+) -> int:
+    """
+    Mount a filesystem from pre-encoded byte strings.
+
+    Fast path for callers whose source/fstype/options are fixed
+    constants: no per-call encoding happens here.
+
+    Args:
+        source: Device or source directory, already encoded
+        target: Mount point, already encoded
+        fstype: Filesystem type, already encoded
+        flags: Mount flags (MS_* constants)
+        options: Filesystem-specific options, already encoded
+
+    Returns:
+        0 on success
+
+    Raises:
+        FilesystemError: If mount fails
+    """
+    ret = libc.mount(source, target, fstype, flags, options)
+
+    if ret != 0:
+        errno = ctypes.get_errno()
+        raise FilesystemError(
+            f"mount({source!r} -> {target!r}, {fstype!r}) failed: errno {errno}"
+        )
+    return ret
+
+
 def mount(
     source: str,
     target: str,
@@ -91,14 +301,7 @@ def mount(
     fstype_bytes = fstype.encode("utf-8") if fstype else None
     options_bytes = options.encode("utf-8") if options else None
 
-    ret = libc.mount(source_bytes, target_bytes, fstype_bytes, flags, options_bytes)
-
-    if ret != 0:
-        errno = ctypes.get_errno()
-        raise FilesystemError(
-            f"mount({source} -> {target}, {fstype}) failed: errno {errno}"
-        )
-    return ret
+    return mount_raw(source_bytes, target_bytes, fstype_bytes, flags, options_bytes)
 
 
 def umount(target: str, flags: int = 0) -> int:
@@ -172,14 +375,10 @@ def pivot_root(new_root: str, put_old: str) -> int:
     """
     # pivot_root is typically called via syscall
     # int pivot_root(const char *new_root, const char *put_old);
-    SYS_pivot_root = 155  # x86_64 syscall number
-
     new_root_bytes = new_root.encode("utf-8")
     put_old_bytes = put_old.encode("utf-8")
 
-    ret = libc.syscall(
-        SYS_pivot_root, ctypes.c_char_p(new_root_bytes), ctypes.c_char_p(put_old_bytes)
-    )
+    ret = _pivot_root_syscall(SYS_pivot_root, new_root_bytes, put_old_bytes)
 
     if ret != 0:
         errno = ctypes.get_errno()
@@ -189,6 +388,52 @@ def pivot_root(new_root: str, put_old: str) -> int:
     return ret
 
 
+def _mount_essential_filesystems(root_path: str, include_devpts: bool = False) -> None:
+    """
+    Mount proc, sys, and dev under a container root in one table pass.
+
+    Shared by setup_chroot_filesystem and setup_pivot_root, which
+    previously duplicated the same makedirs+mount blocks. Each entry
+    tolerates failure (it might already be mounted, or the environment
+    may be restricted); devtmpfs falls back to bind-mounting /dev.
+
+    Args:
+        root_path: Container root the filesystems are mounted under
+        include_devpts: Also mount devpts at dev/pts
+    """
+    table = [
+        ("proc", _B_PROC, _B_PROC, MS_NOSUID | MS_NOEXEC | MS_NODEV),
+        ("sys", _B_SYSFS, _B_SYSFS, MS_NOSUID | MS_NOEXEC | MS_NODEV),
+        ("dev", _B_DEVTMPFS, _B_DEVTMPFS, MS_NOSUID),
+    ]
+
+    for rel, source, fstype, flags in table:
+        target = os.path.join(root_path, rel)
+        os.makedirs(target, exist_ok=True)
+        try:
+            mount_raw(source, target.encode("utf-8"), fstype, flags)
+        except FilesystemError:
+            if fstype is _B_DEVTMPFS:
+                # Fallback: bind mount /dev
+                try:
+                    mount_raw(_B_DEV, target.encode("utf-8"), None, MS_BIND | MS_REC)
+                except FilesystemError:
+                    pass
+
+    if include_devpts:
+        pts_path = os.path.join(root_path, "dev", "pts")
+        os.makedirs(pts_path, exist_ok=True)
+        try:
+            mount_raw(
+                _B_DEVPTS,
+                pts_path.encode("utf-8"),
+                _B_DEVPTS,
+                MS_NOSUID | MS_NOEXEC,
+            )
+        except FilesystemError:
+            pass
+
+
 def setup_chroot_filesystem(rootfs_path: str) -> None:
     """
     Set up filesystem isolation using chroot.
@@ -205,42 +450,7 @@ def setup_chroot_filesystem(rootfs_path: str) -> None:
     if not os.path.isdir(rootfs_path):
         raise FilesystemError(f"Rootfs not found: {rootfs_path}")
 
-    # Mount proc filesystem
-    proc_path = os.path.join(rootfs_path, "proc")
-    os.makedirs(proc_path, exist_ok=True)
-    try:
-        mount("proc", proc_path, "proc", MS_NOSUID | MS_NOEXEC | MS_NODEV)
-    except FilesystemError:
-        pass  # Might already be mounted
-
-    # Mount sys filesystem
-    sys_path = os.path.join(rootfs_path, "sys")
-    os.makedirs(sys_path, exist_ok=True)
-    try:
-        mount("sysfs", sys_path, "sysfs", MS_NOSUID | MS_NOEXEC | MS_NODEV)
-    except FilesystemError:
-        pass
-
-    # Mount dev filesystem (or bind mount from host)
-    dev_path = os.path.join(rootfs_path, "dev")
-    os.makedirs(dev_path, exist_ok=True)
-    try:
-        # Use devtmpfs for /dev
-        mount("devtmpfs", dev_path, "devtmpfs", MS_NOSUID)
-    except FilesystemError:
-        try:
-            # Fallback: bind mount /dev
-            mount("/dev", dev_path, None, MS_BIND | MS_REC)
-        except FilesystemError:
-            pass
-
-    # Create /dev/pts
-    pts_path = os.path.join(rootfs_path, "dev", "pts")
-    os.makedirs(pts_path, exist_ok=True)
-    try:
-        mount("devpts", pts_path, "devpts", MS_NOSUID | MS_NOEXEC)
-    except FilesystemError:
-        pass
+    _mount_essential_filesystems(rootfs_path, include_devpts=True)
 
     # Change root
     chroot(rootfs_path)
@@ -248,7 +458,9 @@ def setup_chroot_filesystem(rootfs_path: str) -> None:
 
 
 def setup_overlay_filesystem(
-    rootfs_path: str, container_id: str
+    rootfs_path: str,
+    container_id: str,
+    paths: Optional[Tuple[str, str, str, str]] = None,
 ) -> Tuple[str, str, str, str]:
     """
     Set up filesystem isolation using OverlayFS.
@@ -262,11 +474,13 @@ def setup_overlay_filesystem(
     Args:
         rootfs_path: Path to base rootfs (becomes lower layer)
         container_id: Container ID for unique paths
+        paths: Optional precomputed (lower, upper, work, merged) tuple,
+               e.g. the paths already stored on the container config
 
     Returns:
         Tuple of (lower, upper, work, merged) paths
     """
-    lower, upper, work, merged = get_overlay_paths(container_id)
+    lower, upper, work, merged = paths or get_overlay_paths(container_id)
 
     # Create directories
     os.makedirs(lower, exist_ok=True)
@@ -280,13 +494,19 @@ def setup_overlay_filesystem(
         try:
             mount(rootfs_path, lower, None, MS_BIND | MS_RDONLY)
         except FilesystemError:
-            # Fallback: copy the rootfs
-            shutil.copytree(rootfs_path, lower, dirs_exist_ok=True)
+            # Fallback: copy the rootfs (reflink/clone where possible)
+            clone_tree(rootfs_path, lower)
 
     # Mount overlay filesystem
     overlay_options = f"lowerdir={lower}," f"upperdir={upper}," f"workdir={work}"
 
-    mount("overlay", merged, "overlay", 0, overlay_options)
+    mount_raw(
+        _B_OVERLAY,
+        merged.encode("utf-8"),
+        _B_OVERLAY,
+        0,
+        overlay_options.encode("utf-8"),
+    )
 
     return lower, upper, work, merged
 
@@ -304,38 +524,17 @@ def setup_pivot_root(merged_path: str) -> None:
         merged_path: Path to the new root (e.g., OverlayFS merged dir)
     """
     # Mount essential filesystems in the new root
-    proc_path = os.path.join(merged_path, "proc")
-    sys_path = os.path.join(merged_path, "sys")
-    dev_path = os.path.join(merged_path, "dev")
-
-    os.makedirs(proc_path, exist_ok=True)
-    os.makedirs(sys_path, exist_ok=True)
-    os.makedirs(dev_path, exist_ok=True)
+    _mount_essential_filesystems(merged_path)
 
-    try:
-        mount("proc", proc_path, "proc", MS_NOSUID | MS_NOEXEC | MS_NODEV)
-    except FilesystemError:
-        pass
-
-    try:
-        mount("sysfs", sys_path, "sysfs", MS_NOSUID | MS_NOEXEC | MS_NODEV)
-    except FilesystemError:
-        pass
-
-    try:
-        mount("devtmpfs", dev_path, "devtmpfs", MS_NOSUID)
-    except FilesystemError:
+    # pivot_root requires new_root to be a mount point. The overlay
+    # merged dir already is one, so only self-bind (recursively, to
+    # carry sub-mounts) when handed a plain directory.
+    if not os.path.ismount(merged_path):
         try:
-            mount("/dev", dev_path, None, MS_BIND | MS_REC)
+            mount(merged_path, merged_path, None, MS_BIND | MS_REC)
         except FilesystemError:
             pass
 
-    # Make new_root a mount point (required for pivot_root, recursively bind mount to carry sub-mounts)
-    try:
-        mount(merged_path, merged_path, None, MS_BIND | MS_REC)
-    except FilesystemError:
-        pass
-
     # Create put_old directory
     put_old = os.path.join(merged_path, ".pivot_old")
     os.makedirs(put_old, exist_ok=True)
@@ -363,14 +562,17 @@ def setup_pivot_root(merged_path: str) -> None:
         pass
 
 
-def cleanup_overlay(container_id: str) -> None:
+def cleanup_overlay(
+    container_id: str, paths: Optional[Tuple[str, str, str, str]] = None
+) -> None:
     """
     Clean up OverlayFS mounts and directories for a container.
 
     Args:
         container_id: Container ID whose overlay to clean up
+        paths: Optional precomputed (lower, upper, work, merged) tuple
     """
-    lower, upper, work, merged = get_overlay_paths(container_id)
+    lower, upper, work, merged = paths or get_overlay_paths(container_id)
 
     # Unmount in reverse order of mounting
     mount_points = [
@@ -382,17 +584,23 @@ def cleanup_overlay(container_id: str) -> None:
         lower,
     ]
 
-    for path in mount_points:
-        if os.path.exists(path):
-            try:
-                umount(path, MNT_DETACH)
-            except FilesystemError:
-                pass
+    def _detach(path: str) -> None:
+        # No stat-before-umount: MNT_DETACH on an unmounted or missing
+        # path fails cheaply with EINVAL/ENOENT
+        try:
+            umount(path, MNT_DETACH)
+        except FilesystemError:
+            pass
+
+    # Lazy unmounts are order-tolerant, so submit all of them at once
+    # instead of serially round-tripping into the kernel
+    with ThreadPoolExecutor(max_workers=len(mount_points)) as executor:
+        list(executor.map(_detach, mount_points))
 
     # Remove directories
     base = os.path.dirname(lower)
     try:
-        shutil.rmtree(base)
+        fast_rmtree(base)
     except (OSError, IOError):
         pass
 
@@ -407,24 +615,15 @@ def setup_minimal_dev(rootfs_path: str) -> None:
     dev_path = os.path.join(rootfs_path, "dev")
     os.makedirs(dev_path, exist_ok=True)
 
-    # Create essential device nodes
-    devices = [
-        ("null", 1, 3, 0o666),
-        ("zero", 1, 5, 0o666),
-        ("random", 1, 8, 0o666),
-        ("urandom", 1, 9, 0o666),
-        ("tty", 5, 0, 0o666),
-        ("console", 5, 1, 0o620),
-    ]
-
-    for name, major, minor, mode in devices:
-        path = os.path.join(dev_path, name)
-        if not os.path.exists(path):
-            try:
-                # mknod for character device
-                os.mknod(path, mode | 0o020000, os.makedev(major, minor))
-            except (OSError, PermissionError):
-                pass
+    # Create each node directly and treat EEXIST as success; this halves
+    # the syscalls compared to a stat-then-mknod round-trip per entry.
+    # Modes and device numbers come precomputed from _MIN_DEV_NODES.
+    for name, mode, device in _MIN_DEV_NODES:
+        try:
+            # mknod for character device
+            os.mknod(os.path.join(dev_path, name), mode, device)
+        except (OSError, PermissionError):
+            pass
 
     # Create symlinks
     symlinks = [
@@ -436,8 +635,7 @@ def setup_minimal_dev(rootfs_path: str) -> None:
 
     for name, target in symlinks:
         path = os.path.join(dev_path, name)
-        if not os.path.exists(path):
-            try:
-                os.symlink(target, path)
-            except OSError:
-                pass
+        try:
+            os.symlink(target, path)
+        except OSError:
+            pass
@@ -16,13 +16,28 @@ Supported Instructions:
 Each instruction creates a layer in the OverlayFS structure.
 """
 
+import json
 import os
+import re
 import shlex
 import shutil
 import subprocess
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
+from mini_docker.filesystem import (
+    MNT_DETACH,
+    FilesystemError,
+    clone_file,
+    clone_tree,
+    fast_rmtree,
+    mount,
+    umount,
+)
 from mini_docker.utils import IMAGES_PATH, ensure_directories, generate_container_id
 
 
@@ -34,6 +49,9 @@ class ImageLayer:
     instruction: str
     command: str
     created_at: float = 0
+    # Set when the instruction produced no filesystem delta: the layer
+    # aliases its parent instead of materializing a directory.
+    parent_id: str = ""
 
 
 @dataclass
@@ -48,6 +66,9 @@ class ImageConfig:
     workdir: str = "/"
     cmd: List[str] = field(default_factory=list)
     entrypoint: List[str] = field(default_factory=list)
+    # True when layers hold only per-instruction deltas composed via
+    # OverlayFS, rather than full rootfs copies.
+    layered: bool = False
 
 
 class BuildError(Exception):
@@ -62,6 +83,15 @@ class ImageError(Exception):
     pass
 
 
+# Matches one logical instruction line, including backslash continuations,
+# so the whole file is parsed in a single C-level regex sweep instead of
+# per-line Python string ops
+_INSTRUCTION_RE = re.compile(
+    r"^[ \t]*(?!#)(\S+)[ \t]*((?:[^\n]*\\[ \t]*\n)*[^\n]*)", re.MULTILINE
+)
+_CONTINUATION_RE = re.compile(r"\\[ \t]*\n")
+
+
 def parse_image_file(content: str) -> List[Tuple[str, str]]:
     """
     Parse image build file (simplified Dockerfile).
@@ -73,29 +103,12 @@ def parse_image_file(content: str) -> List[Tuple[str, str]]:
         List of (instruction, arguments) tuples
     """
     instructions = []
-    current_line = ""
-
-    for line in content.split("\n"):
-        # Skip comments and empty lines
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        # Handle line continuation
-        if stripped.endswith("\\"):
-            current_line += stripped[:-1].rstrip() + " "
-            continue
-
-        current_line += stripped
 
-        # Parse instruction
-        parts = current_line.split(None, 1)
-        if len(parts) >= 1:
-            instruction = parts[0].upper()
-            args = parts[1] if len(parts) > 1 else ""
-            instructions.append((instruction, args))
-
-        current_line = ""
+    for match in _INSTRUCTION_RE.finditer(content):
+        args = " ".join(
+            piece.strip() for piece in _CONTINUATION_RE.split(match.group(2))
+        ).strip()
+        instructions.append((match.group(1).upper(), args))
 
     return instructions
 
@@ -110,6 +123,35 @@ def get_layer_path(image_id: str, layer_id: str) -> str:
     return os.path.join(get_image_path(image_id), "layers", layer_id)
 
 
+def overlay_available() -> bool:
+    """Check whether this process can create OverlayFS mounts."""
+    base = tempfile.mkdtemp(prefix="mini-docker-overlay-probe-")
+    lower = os.path.join(base, "lower")
+    upper = os.path.join(base, "upper")
+    work = os.path.join(base, "work")
+    merged = os.path.join(base, "merged")
+    try:
+        for directory in (lower, upper, work, merged):
+            os.makedirs(directory)
+        try:
+            mount(
+                "overlay",
+                merged,
+                "overlay",
+                0,
+                f"lowerdir={lower},upperdir={upper},workdir={work}",
+            )
+        except FilesystemError:
+            return False
+        try:
+            umount(merged, MNT_DETACH)
+        except FilesystemError:
+            pass
+        return True
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
 class ImageBuilder:
     """
     Build container images from build files.
@@ -127,6 +169,9 @@ class ImageBuilder:
         self.workdir = "/"
         self.cmd: List[str] = []
         self.entrypoint: List[str] = []
+        # Set per-build: when True, layers store only deltas and are
+        # composed with OverlayFS instead of full-tree copies.
+        self.layered = False
 
     def build(self, build_file: str, name: str = "", no_cache: bool = False) -> str:
         """
@@ -151,6 +196,11 @@ class ImageBuilder:
         if not instructions:
             raise BuildError("No instructions found in build file")
 
+        # Prefer delta layers stacked with OverlayFS; fall back to
+        # full-tree copies when overlay mounts are unavailable
+        # (e.g. unprivileged builds).
+        self.layered = overlay_available()
+
         # Parse name and tag
         image_name = name or "image"
         image_tag = "latest"
@@ -179,6 +229,7 @@ class ImageBuilder:
             workdir=self.workdir,
             cmd=self.cmd,
             entrypoint=self.entrypoint,
+            layered=self.layered,
         )
         self._save_config(image_id, config)
 
@@ -206,8 +257,6 @@ class ImageBuilder:
 
     def _create_layer(self, image_id: str, instruction: str, command: str) -> str:
         """Create a new layer."""
-        import time
-
         layer_id = generate_container_id()
         layer_path = get_layer_path(image_id, layer_id)
         os.makedirs(layer_path, exist_ok=True)
@@ -223,6 +272,29 @@ class ImageBuilder:
 
         return layer_path
 
+    def _lower_layer_paths(self, image_id: str) -> List[str]:
+        """Paths of all layers below the current one, topmost first."""
+        return [
+            get_layer_path(image_id, layer.id)
+            for layer in reversed(self.layers[:-1])
+            if not layer.parent_id
+        ]
+
+    def _mount_layer_view(self, upper: str, lowers: List[str]) -> str:
+        """
+        Mount an overlay view of previous layers with ``upper`` as the
+        writable delta. Returns the merged mount point; only the delta is
+        materialized on disk.
+        """
+        work = f"{upper}-work"
+        merged = f"{upper}-merged"
+        os.makedirs(work, exist_ok=True)
+        os.makedirs(merged, exist_ok=True)
+
+        options = f"lowerdir={':'.join(lowers)},upperdir={upper},workdir={work}"
+        mount("overlay", merged, "overlay", 0, options)
+        return merged
+
     def _handle_from(self, image_id: str, args: str, context: str) -> None:
         """Handle FROM instruction."""
         base_path = args.strip()
@@ -237,8 +309,8 @@ class ImageBuilder:
         # Create base layer
         layer_path = self._create_layer(image_id, "FROM", args)
 
-        # Copy base image to layer
-        shutil.copytree(base_path, layer_path, dirs_exist_ok=True, symlinks=True)
+        # Copy base image to layer (reflink/clone where possible)
+        clone_tree(base_path, layer_path)
 
     def _handle_run(self, image_id: str, args: str, context: str) -> None:
         """Handle RUN instruction."""
@@ -247,21 +319,24 @@ class ImageBuilder:
 
         layer_path = self._create_layer(image_id, "RUN", args)
 
-        # Get previous layer for overlay
-        if len(self.layers) > 1:
-            prev_layer = self.layers[-2]
-            prev_path = get_layer_path(image_id, prev_layer.id)
+        # Layered mode: mount previous layers read-only under an empty
+        # upper dir so the command's writes land in the delta only.
+        # Legacy mode: materialize a full copy of the previous layer.
+        merged = None
+        if self.layered:
+            merged = self._mount_layer_view(
+                layer_path, self._lower_layer_paths(image_id)
+            )
+            run_root = merged
         else:
-            prev_path = layer_path
+            if len(self.layers) > 1:
+                prev_layer = self.layers[-2]
+                prev_path = get_layer_path(image_id, prev_layer.id)
+                clone_tree(prev_path, layer_path)
+            run_root = layer_path
 
         # Execute the command inside the layer rootfs, not on the host.
         try:
-            # Copy from previous layer
-            if prev_path != layer_path:
-                shutil.copytree(
-                    prev_path, layer_path, dirs_exist_ok=True, symlinks=True
-                )
-
             if os.name != "posix" or not hasattr(os, "geteuid"):
                 raise BuildError("RUN instructions require a Linux host")
             if os.geteuid() != 0:
@@ -275,21 +350,62 @@ class ImageBuilder:
             if self.workdir and self.workdir != "/":
                 run_command = f"cd {shlex.quote(self.workdir)} && {args}"
 
-            result = subprocess.run(
-                [chroot_bin, layer_path, "/bin/sh", "-c", run_command],
-                capture_output=True,
-                text=True,
+            # Keep only a bounded tail of stderr; buffering a chatty
+            # command's full output just to report failures can cost
+            # tens of megabytes. stdout is discarded unread.
+            with subprocess.Popen(
+                [chroot_bin, run_root, "/bin/sh", "-c", run_command],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 env=self.env or None,
-            )
+            ) as proc:
+                stderr_tail = deque(iter(proc.stderr.readline, b""), maxlen=256)
 
-            if result.returncode != 0:
-                stderr = result.stderr.strip()
-                stdout = result.stdout.strip()
-                details = stderr or stdout or f"exit code {result.returncode}"
+            if proc.returncode != 0:
+                stderr = b"".join(stderr_tail).decode("utf-8", "replace").strip()
+                details = stderr or f"exit code {proc.returncode}"
                 raise BuildError(f"RUN failed: {details}")
 
-        except subprocess.CalledProcessError as e:
-            raise BuildError(f"RUN failed: {e}")
+        finally:
+            if merged is not None:
+                try:
+                    umount(merged, MNT_DETACH)
+                except FilesystemError:
+                    pass
+
+        # A RUN that wrote nothing leaves an empty delta; alias the
+        # previous layer rather than stacking a no-op lowerdir entry
+        if self.layered and len(self.layers) > 1 and not os.listdir(layer_path):
+            try:
+                os.rmdir(layer_path)
+            except OSError:
+                pass
+            else:
+                self.layers[-1].parent_id = self.layers[-2].id
+
+    def _dest_is_dir(self, image_id: str, dest_path: str, dest_rel: str) -> bool:
+        """
+        Whether a COPY destination is a directory in the composed image.
+
+        The delta layer starts empty in layered mode, so a directory
+        that exists only in lower layers is invisible to a plain isdir
+        on the upper path. Probe the lower layers topmost-first - the
+        order OverlayFS resolves paths - and let the first layer that
+        has the entry decide its type.
+        """
+        if os.path.isdir(dest_path):
+            return True
+        if os.path.lexists(dest_path):
+            return False
+        if not self.layered:
+            return False
+        for lower in self._lower_layer_paths(image_id):
+            candidate = os.path.join(lower, dest_rel)
+            if os.path.isdir(candidate):
+                return True
+            if os.path.lexists(candidate):
+                return False
+        return False
 
     def _handle_copy(self, image_id: str, args: str, context: str) -> None:
         """Handle COPY instruction."""
@@ -304,22 +420,45 @@ class ImageBuilder:
 
         layer_path = self._create_layer(image_id, "COPY", args)
 
-        # Copy from previous layer first
-        if len(self.layers) > 1:
+        # In layered mode the sources land directly in the empty delta
+        # layer; OverlayFS composes them over the lower layers at use time.
+        # Legacy mode needs the previous layer materialized first.
+        if not self.layered and len(self.layers) > 1:
             prev_layer = self.layers[-2]
             prev_path = get_layer_path(image_id, prev_layer.id)
-            shutil.copytree(prev_path, layer_path, dirs_exist_ok=True, symlinks=True)
+            clone_tree(prev_path, layer_path)
 
         # Copy sources to destination
-        dest_path = os.path.join(layer_path, dest.lstrip("/"))
+        dest_rel = dest.lstrip("/")
+        dest_path = os.path.join(layer_path, dest_rel)
         os.makedirs(os.path.dirname(dest_path), exist_ok=True)
 
+        # One scandir over the build context batches the per-source
+        # type checks; nested source paths still fall back to a stat
+        is_dir_by_name: Dict[str, bool] = {}
+        try:
+            with os.scandir(context) as entries:
+                is_dir_by_name = {entry.name: entry.is_dir() for entry in entries}
+        except OSError:
+            pass
+
         for src in sources:
             src_path = os.path.join(context, src)
-            if os.path.isdir(src_path):
-                shutil.copytree(src_path, dest_path, dirs_exist_ok=True, symlinks=True)
-            else:
+            src_is_dir = is_dir_by_name.get(src)
+            if src_is_dir is None:
+                src_is_dir = os.path.isdir(src_path)
+            if src_is_dir:
+                clone_tree(src_path, dest_path)
+            elif os.path.islink(src_path):
                 shutil.copy2(src_path, dest_path, follow_symlinks=False)
+            elif self._dest_is_dir(image_id, dest_path, dest_rel):
+                # The directory may live only in lower layers; create
+                # it in the delta so the copy lands inside it and the
+                # composed view merges the two
+                os.makedirs(dest_path, exist_ok=True)
+                clone_file(src_path, os.path.join(dest_path, os.path.basename(src)))
+            else:
+                clone_file(src_path, dest_path)
 
     def _handle_env(self, image_id: str, args: str, context: str) -> None:
         """Handle ENV instruction."""
@@ -340,8 +479,6 @@ class ImageBuilder:
         # Parse as JSON array or shell command
         args = args.strip()
         if args.startswith("["):
-            import json
-
             try:
                 self.cmd = json.loads(args)
             except json.JSONDecodeError:
@@ -353,8 +490,6 @@ class ImageBuilder:
         """Handle ENTRYPOINT instruction."""
         args = args.strip()
         if args.startswith("["):
-            import json
-
             try:
                 self.entrypoint = json.loads(args)
             except json.JSONDecodeError:
@@ -364,62 +499,136 @@ class ImageBuilder:
 
     def _save_config(self, image_id: str, config: ImageConfig) -> None:
         """Save image configuration."""
-        import json
-        from dataclasses import asdict
-
         config_path = os.path.join(get_image_path(image_id), "config.json")
 
-        # Convert layers to dicts
-        data = asdict(config)
+        # Build the dict by hand: asdict() deep-copies every field via
+        # recursive introspection, which dominates for many-layer images
+        data = {
+            "id": config.id,
+            "name": config.name,
+            "tag": config.tag,
+            "layers": [
+                {
+                    "id": layer.id,
+                    "instruction": layer.instruction,
+                    "command": layer.command,
+                    "created_at": layer.created_at,
+                    "parent_id": layer.parent_id,
+                }
+                for layer in config.layers
+            ],
+            "env": config.env,
+            "workdir": config.workdir,
+            "cmd": config.cmd,
+            "entrypoint": config.entrypoint,
+            "layered": config.layered,
+        }
 
         with open(config_path, "w") as f:
-            json.dump(data, f, indent=2)
+            json.dump(data, f)
 
     def get_rootfs(self, image_id: str) -> str:
         """Get path to final rootfs for an image."""
-        # Return last layer as rootfs
         config_path = os.path.join(get_image_path(image_id), "config.json")
 
         if not os.path.exists(config_path):
             raise BuildError(f"Image not found: {image_id}")
 
-        import json
-
         with open(config_path, "r") as f:
             config = json.load(f)
 
         if not config.get("layers"):
             raise BuildError("Image has no layers")
 
-        last_layer = config["layers"][-1]
-        return get_layer_path(image_id, last_layer["id"])
+        layer_ids = [
+            layer["id"] for layer in config["layers"] if not layer.get("parent_id")
+        ]
 
+        if config.get("layered"):
+            return _mount_layered_rootfs(image_id, layer_ids)
 
-def list_images() -> List[ImageConfig]:
-    """List all built images."""
-    import json
+        # Legacy full-copy chains: the last layer is a complete rootfs.
+        return get_layer_path(image_id, layer_ids[-1])
 
-    images = []
 
-    if not os.path.exists(IMAGES_PATH):
-        return images
+def _mount_layered_rootfs(image_id: str, layer_ids: List[str]) -> str:
+    """Compose delta layers into a read-only rootfs mount."""
+    layer_paths = [get_layer_path(image_id, layer_id) for layer_id in layer_ids]
+    if len(layer_paths) == 1:
+        return layer_paths[0]
 
-    for image_id in os.listdir(IMAGES_PATH):
-        config_path = os.path.join(get_image_path(image_id), "config.json")
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, "r") as f:
-                    data = json.load(f)
+    rootfs = os.path.join(get_image_path(image_id), "rootfs")
+    os.makedirs(rootfs, exist_ok=True)
 
-                # Convert layers dicts to dataclass
-                layers = [ImageLayer(**layer) for layer in data.get("layers", [])]
-                data["layers"] = layers
+    if not os.path.ismount(rootfs):
+        # lowerdir lists the topmost layer first
+        options = "lowerdir=" + ":".join(reversed(layer_paths))
+        try:
+            mount("overlay", rootfs, "overlay", 0, options)
+        except FilesystemError as e:
+            raise BuildError(f"Cannot mount layered image rootfs: {e}")
 
-                images.append(ImageConfig(**data))
-            except (json.JSONDecodeError, TypeError):
-                pass
+    return rootfs
+
+
+def get_rootfs_from_config(image_id: str, config: ImageConfig) -> str:
+    """
+    Resolve the rootfs path from an already-loaded image config.
+
+    Avoids re-opening config.json when the caller just listed images.
+
+    Args:
+        image_id: Image ID
+        config: Parsed image configuration
+
+    Returns:
+        Path to the image rootfs
+    """
+    if not config.layers:
+        raise BuildError("Image has no layers")
 
-    return images
+    layer_ids = [layer.id for layer in config.layers if not layer.parent_id]
+
+    if config.layered:
+        return _mount_layered_rootfs(image_id, layer_ids)
+
+    return get_layer_path(image_id, layer_ids[-1])
+
+
+def _load_image_config(image_dir: str) -> Optional[ImageConfig]:
+    """Load and parse one image's config.json, or None if invalid."""
+    config_path = os.path.join(image_dir, "config.json")
+    try:
+        with open(config_path, "r") as f:
+            data = json.load(f)
+
+        # Convert layers dicts to dataclass
+        layers = [ImageLayer(**layer) for layer in data.get("layers", [])]
+        data["layers"] = layers
+
+        return ImageConfig(**data)
+    except (OSError, json.JSONDecodeError, TypeError):
+        return None
+
+
+def list_images() -> List[ImageConfig]:
+    """List all built images."""
+    try:
+        with os.scandir(IMAGES_PATH) as entries:
+            image_dirs = [entry.path for entry in entries]
+    except FileNotFoundError:
+        return []
+
+    if not image_dirs:
+        return []
+
+    # Config reads are independent and I/O-bound, so load them in
+    # parallel; the invalid ones come back as None
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(image_dirs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        configs = executor.map(_load_image_config, image_dirs)
+
+    return [config for config in configs if config is not None]
 
 
 def resolve_image_path(name_or_id: str) -> Optional[str]:
@@ -437,7 +646,7 @@ def resolve_image_path(name_or_id: str) -> Optional[str]:
     # Try exact ID match or prefix
     for img in images:
         if img.id.startswith(name_or_id):
-            return ImageBuilder().get_rootfs(img.id)
+            return get_rootfs_from_config(img.id, img)
 
     # Try name:tag
     target_name = name_or_id
@@ -447,7 +656,7 @@ def resolve_image_path(name_or_id: str) -> Optional[str]:
 
     for img in images:
         if img.name == target_name and img.tag == target_tag:
-            return ImageBuilder().get_rootfs(img.id)
+            return get_rootfs_from_config(img.id, img)
 
     return None
 
@@ -496,9 +705,17 @@ def remove_image(name_or_id: str, force: bool = False) -> bool:
 
     image_path = get_image_path(target_image.id)
 
+    # Layered images may have their composed rootfs mounted
+    rootfs_mount = os.path.join(image_path, "rootfs")
+    if os.path.ismount(rootfs_mount):
+        try:
+            umount(rootfs_mount, MNT_DETACH)
+        except FilesystemError:
+            pass
+
     try:
         if os.path.exists(image_path):
-            shutil.rmtree(image_path)
+            fast_rmtree(image_path)
         return True
     except OSError as e:
         raise ImageError(f"Cannot remove image: {e}")
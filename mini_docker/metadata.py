@@ -8,8 +8,9 @@ Stores container configuration and state in JSON format:
 
 import json
 import os
+import threading
 import time
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 from mini_docker.utils import (
@@ -115,21 +116,53 @@ class ContainerConfig:
             self.hostname = self.name
 
 
+# mtime-validated cache of parsed config.json payloads: repeat lookups
+# (every list_containers / find_container_id call re-reads each config)
+# cost one stat instead of an open + flock + json parse per container
+_CONFIG_CACHE: Dict[str, tuple] = {}
+
+
 def _container_config_path(container_id: str) -> str:
     return os.path.join(get_container_path(container_id), "config.json")
 
 
+def _config_to_dict(config: ContainerConfig) -> Dict:
+    """
+    Serialize a config to a JSON-ready dict by direct attribute access.
+
+    dataclasses.asdict deep-copies every field through recursive
+    introspection; with nested ResourceLimits/NetworkConfig and a save
+    on every state transition that cost adds up.
+    """
+    data = dict(config.__dict__)
+    data["resources"] = dict(config.resources.__dict__)
+    data["network"] = dict(config.network.__dict__)
+    return data
+
+
 def _list_container_ids() -> List[str]:
-    if not os.path.exists(CONTAINERS_PATH):
+    # scandir over listdir: the names come straight from the directory
+    # read without the separate exists() stat on the parent
+    try:
+        with os.scandir(CONTAINERS_PATH) as entries:
+            return sorted(entry.name for entry in entries)
+    except FileNotFoundError:
         return []
-    return sorted(os.listdir(CONTAINERS_PATH))
 
 
 def _read_container_data(container_id: str) -> Optional[Dict]:
     config_path = _container_config_path(container_id)
-    if not os.path.exists(config_path):
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
+        _CONFIG_CACHE.pop(container_id, None)
         return None
 
+    cached = _CONFIG_CACHE.get(container_id)
+    if cached is not None and cached[0] == mtime_ns:
+        # Hand out a shallow copy; hydration replaces nested keys
+        return dict(cached[1])
+
     import fcntl
 
     try:
@@ -137,12 +170,15 @@ def _read_container_data(container_id: str) -> Optional[Dict]:
         try:
             fcntl.flock(fd, fcntl.LOCK_SH)
             data = os.read(fd, 65536)
-            return json.loads(data.decode("utf-8"))
+            parsed = json.loads(data.decode("utf-8"))
         finally:
             os.close(fd)
     except (json.JSONDecodeError, OSError):
         return None
 
+    _CONFIG_CACHE[container_id] = (mtime_ns, parsed)
+    return dict(parsed)
+
 
 def _hydrate_container_config(data: Dict) -> Optional[ContainerConfig]:
     try:
@@ -214,27 +250,34 @@ def container_exists(container_id: str) -> bool:
 
 def save_container_config(config: ContainerConfig) -> str:
     """Save container configuration to disk."""
-    import fcntl
-
     ensure_directories()
 
     container_path = get_container_path(config.id)
     os.makedirs(container_path, exist_ok=True)
 
+    # Write to a temp file and rename over the target: readers see
+    # either the old or the new complete config, never a truncated one,
+    # and the whole save is a single write(2) plus fsync. The temp
+    # name carries the writer's pid and thread id so concurrent saves
+    # (daemon threads, or daemon plus CLI) never truncate each other's
+    # staging file or race the rename
     config_path = _container_config_path(config.id)
-    fd = os.open(config_path, os.O_RDWR | os.O_CREAT)
+    tmp_path = f"{config_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    data = _config_to_dict(config)
+    payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
-        fcntl.flock(fd, fcntl.LOCK_EX)
-        payload = json.dumps(asdict(config), indent=2).encode("utf-8")
-        os.lseek(fd, 0, os.SEEK_SET)
-        os.ftruncate(fd, 0)
         os.write(fd, payload)
+        os.fsync(fd)
+        mtime_ns = os.fstat(fd).st_mtime_ns
     finally:
-        try:
-            fcntl.flock(fd, fcntl.LOCK_UN)
-        except OSError:
-            pass
         os.close(fd)
+    os.rename(tmp_path, config_path)
+
+    # Write-through so the next read is served from cache (rename
+    # preserves the inode mtime)
+    _CONFIG_CACHE[config.id] = (mtime_ns, data)
 
     return config_path
 
@@ -290,6 +333,7 @@ def delete_container_config(container_id: str) -> bool:
     if not full_id:
         return False
 
+    _CONFIG_CACHE.pop(full_id, None)
     try:
         shutil.rmtree(get_container_path(full_id))
         return True
@@ -323,27 +367,29 @@ def find_container_id(prefix: str) -> Optional[str]:
     if container_exists(prefix):
         return prefix
 
-    for container_id in container_ids:
-        data = _read_container_data(container_id)
-        if data and data.get("name") == prefix:
-            return container_id
-
-    matches = []
-    for container_id in container_ids:
-        if container_id.startswith(prefix):
-            matches.append(container_id)
-
+    # Cheap pass first: an ID-prefix match is pure string comparison
+    # over directory names. IDs are the common addressing mode, so most
+    # lookups resolve without parsing a single config.
+    matches = [cid for cid in container_ids if cid.startswith(prefix)]
     if len(matches) == 1:
         return matches[0]
     if len(matches) > 1:
         raise ContainerLookupAmbiguityError(prefix, matches)
 
+    # Only a name lookup needs the configs loaded
+    for container_id in container_ids:
+        data = _read_container_data(container_id)
+        if data and data.get("name") == prefix:
+            return container_id
+
     return None
 
 
 def get_container_log_path(container_id: str) -> str:
     """Get path to container log file."""
-    return os.path.join(get_container_path(container_id), "container.log")
+    # Computed live, not cached: the join is trivial and the result
+    # must follow CONTAINERS_PATH when callers point it elsewhere
+    return f"{get_container_path(container_id)}/container.log"
 
 
 class MetadataStore:
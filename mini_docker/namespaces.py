@@ -20,6 +20,14 @@ from typing import List, Optional
 
 from mini_docker.utils import libc
 
+# Declaring prototypes once lets ctypes skip per-call type inference
+libc.unshare.argtypes = [ctypes.c_int]
+libc.unshare.restype = ctypes.c_int
+libc.setns.argtypes = [ctypes.c_int, ctypes.c_int]
+libc.setns.restype = ctypes.c_int
+libc.sethostname.argtypes = [ctypes.c_char_p, ctypes.c_size_t]
+libc.sethostname.restype = ctypes.c_int
+
 # Namespace flags from <linux/sched.h>
 CLONE_NEWNS = 0x00020000  # Mount namespace
 CLONE_NEWUTS = 0x04000000  # UTS namespace (hostname)
@@ -40,6 +48,30 @@ NAMESPACE_FLAGS = {
     "cgroup": CLONE_NEWCGROUP,
 }
 
+# Pre-OR'd flag values for the namespace sets every container launch
+# uses, so the common case skips the per-entry dict lookups
+_COMMON_FLAG_COMBOS = {
+    frozenset(("pid", "uts", "mnt", "ipc")): (
+        CLONE_NEWPID | CLONE_NEWUTS | CLONE_NEWNS | CLONE_NEWIPC
+    ),
+    frozenset(("pid", "uts", "mnt", "ipc", "net")): (
+        CLONE_NEWPID | CLONE_NEWUTS | CLONE_NEWNS | CLONE_NEWIPC | CLONE_NEWNET
+    ),
+}
+
+
+def _combined_flags(namespaces: List[str]) -> int:
+    """OR together the CLONE_NEW* flags for a namespace list."""
+    flags = _COMMON_FLAG_COMBOS.get(frozenset(namespaces))
+    if flags is not None:
+        return flags
+
+    flags = 0
+    for ns in namespaces:
+        flags |= NAMESPACE_FLAGS.get(ns, 0)
+    return flags
+
+
 # Namespace type to /proc path mapping
 NAMESPACE_PATHS = {
     "mnt": "ns/mnt",
@@ -151,17 +183,12 @@ def create_namespaces(
     Raises:
         NamespaceError: If any namespace creation fails
     """
-    flags = 0
+    flags = _combined_flags(namespaces)
 
     # For rootless mode, we need user namespace first
     if rootless:
         flags |= CLONE_NEWUSER
 
-    # Build combined flags
-    for ns in namespaces:
-        if ns in NAMESPACE_FLAGS:
-            flags |= NAMESPACE_FLAGS[ns]
-
     # Perform unshare
     unshare(flags)
 
@@ -208,6 +235,42 @@ def enter_namespace(pid: int, nstype: str) -> None:
         os.close(fd)
 
 
+def enter_namespaces_pidfd(pid: int, namespaces: Optional[List[str]] = None) -> None:
+    """
+    Enter another process's namespaces with a single setns(2) call.
+
+    Since Linux 5.8, setns accepts a pidfd together with a combined
+    CLONE_NEW* mask and enters every requested namespace atomically,
+    instead of one open + setns round-trip per /proc/<pid>/ns/* file.
+
+    Args:
+        pid: Process ID whose namespaces to enter
+        namespaces: Optional list of specific namespaces to enter
+                   (defaults to all available)
+
+    Raises:
+        NamespaceError: If pidfds are unsupported or setns fails
+    """
+    if namespaces is None:
+        namespaces = ["mnt", "uts", "ipc", "pid", "net"]
+
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        raise NamespaceError("pidfd_open not available on this platform")
+
+    flags = _combined_flags(namespaces)
+
+    try:
+        pidfd = pidfd_open(pid, 0)
+    except OSError as e:
+        raise NamespaceError(f"pidfd_open({pid}) failed: {e}")
+
+    try:
+        setns(pidfd, flags)
+    finally:
+        os.close(pidfd)
+
+
 def enter_all_namespaces(pid: int, namespaces: Optional[List[str]] = None) -> None:
     """
     Enter all namespaces of another process.
@@ -322,12 +385,11 @@ class Namespace:
         self.original_ns_fds = {}
 
     def __enter__(self):
-        # Save original namespace FDs
+        # Save original namespace FDs; open directly and let a missing
+        # namespace surface as an error rather than stat-ing first
         for ns in self.namespaces:
             try:
-                path = f"/proc/self/ns/{ns}"
-                if os.path.exists(path):
-                    self.original_ns_fds[ns] = os.open(path, os.O_RDONLY)
+                self.original_ns_fds[ns] = os.open(f"/proc/self/ns/{ns}", os.O_RDONLY)
             except OSError:
                 pass
 
@@ -34,11 +34,14 @@ Network Architecture:
     └─────────────────────────────────────────────────────────────┘
 """
 
+import asyncio
 import os
+import shutil
 import subprocess
-from typing import Optional, Tuple
+import threading
+from typing import List, Optional, Tuple
 
-from mini_docker.utils import generate_mac_address, get_available_ip
+from mini_docker.utils import generate_mac_address, get_available_ip, release_ip
 
 # Network configuration
 BRIDGE_NAME = "mini-docker0"
@@ -47,6 +50,14 @@ BRIDGE_SUBNET = "10.0.0.0/24"
 BRIDGE_NETMASK = "255.255.255.0"
 
 
+# Process-wide readiness flags: the bridge and NAT rules survive until
+# someone tears them down, so once confirmed they are never re-probed
+# for subsequent container launches in the same process
+_ready_lock = threading.Lock()
+_bridge_ready = False
+_nat_ready = False
+
+
 class NetworkError(Exception):
     """Exception raised for network operations."""
 
@@ -104,6 +115,41 @@ def run_ip_command(args: list, check: bool = True) -> subprocess.CompletedProces
     return subprocess.run(cmd, capture_output=True, text=True, check=check)
 
 
+def run_ip_batch(
+    commands: List[list], force: bool = False
+) -> subprocess.CompletedProcess:
+    """
+    Run several 'ip' commands with a single fork via 'ip -batch -'.
+
+    Each fork+exec of the ip binary costs more than the netlink work it
+    performs, so multi-step sequences are fed to one batch process over
+    stdin. By default the batch stops at the first failing command,
+    matching the sequential check=True semantics of run_ip_command;
+    with force=True every command runs regardless of earlier failures,
+    matching a sequence of check=False calls.
+
+    Args:
+        commands: List of argument lists, each without the leading 'ip'
+        force: Keep executing past failing commands (best-effort mode)
+
+    Returns:
+        CompletedProcess instance
+
+    Raises:
+        subprocess.CalledProcessError: If any command fails and force
+                                       is not set
+    """
+    script = "".join(" ".join(args) + "\n" for args in commands)
+    cmd = ["ip", "-force", "-batch", "-"] if force else ["ip", "-batch", "-"]
+    return subprocess.run(
+        cmd,
+        input=script,
+        capture_output=True,
+        text=True,
+        check=not force,
+    )
+
+
 def run_iptables_command(args: list, check: bool = True) -> subprocess.CompletedProcess:
     """
     Run an 'iptables' command.
@@ -119,6 +165,155 @@ def run_iptables_command(args: list, check: bool = True) -> subprocess.Completed
     return subprocess.run(cmd, capture_output=True, text=True, check=check)
 
 
+# Long-lived iptables-restore process: its stdin stays open and each
+# COMMIT-terminated blob written to it is applied as one atomic batch,
+# so the binary startup and kernel table copy are paid once per daemon
+# lifetime instead of once per batch
+_nat_pipe: Optional[subprocess.Popen] = None
+_nat_pipe_lock = threading.Lock()
+
+
+def _get_nat_pipe() -> Optional[subprocess.Popen]:
+    """The shared iptables-restore process, spawning it on first use."""
+    global _nat_pipe
+    if _nat_pipe is not None and _nat_pipe.poll() is None:
+        return _nat_pipe
+    try:
+        _nat_pipe = subprocess.Popen(
+            ["iptables-restore", "--noflush", "--wait"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except OSError:
+        _nat_pipe = None
+    return _nat_pipe
+
+
+def close_nat_pipe() -> None:
+    """Shut down the shared iptables-restore process, if running."""
+    global _nat_pipe
+    with _nat_pipe_lock:
+        pipe = _nat_pipe
+        _nat_pipe = None
+    if pipe is not None:
+        try:
+            pipe.stdin.close()
+            pipe.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            pipe.kill()
+
+
+def run_iptables_restore(rules: str) -> subprocess.CompletedProcess:
+    """
+    Install a batch of rules in one atomic iptables-restore commit.
+
+    Batches stream through the persistent process when it is healthy; a
+    rejected blob kills it (iptables-restore exits on parse errors), in
+    which case the batch is replayed through a one-shot process whose
+    exit status is authoritative.
+
+    Args:
+        rules: Rules blob in iptables-save format (including COMMIT)
+
+    Returns:
+        CompletedProcess instance
+
+    Raises:
+        subprocess.CalledProcessError: If the restore fails
+    """
+    with _nat_pipe_lock:
+        pipe = _get_nat_pipe()
+        if pipe is not None:
+            try:
+                pipe.stdin.write(rules)
+                pipe.stdin.flush()
+                if pipe.poll() is None:
+                    return subprocess.CompletedProcess(
+                        ["iptables-restore", "--noflush", "--wait"], 0
+                    )
+            except (BrokenPipeError, OSError):
+                pass
+
+    return subprocess.run(
+        ["iptables-restore", "--noflush", "--wait"],
+        input=rules,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+# Cached probe for the nft binary; resolved once per process
+_nft_available: Optional[bool] = None
+
+
+def _nft_supported() -> bool:
+    """Whether the nft binary is available for transactional NAT setup."""
+    global _nft_available
+    if _nft_available is None:
+        _nft_available = shutil.which("nft") is not None
+    return _nft_available
+
+
+def run_nft(ruleset: str) -> subprocess.CompletedProcess:
+    """
+    Apply an nft ruleset in one atomic transaction.
+
+    nftables commits the whole blob as a single NFNETLINK batch, so
+    there is no per-rule table copy and no xtables lock contention.
+
+    Args:
+        ruleset: Ruleset text in nft -f syntax
+
+    Returns:
+        CompletedProcess instance
+
+    Raises:
+        subprocess.CalledProcessError: If the transaction is rejected
+    """
+    return subprocess.run(
+        ["nft", "-f", "-"],
+        input=ruleset,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _setup_nat_nft(subnet: str) -> None:
+    """
+    Declare the Mini-Docker NAT ruleset in its own nftables table.
+
+    The declare-flush-declare shape makes the transaction idempotent:
+    re-running replaces the table contents instead of appending
+    duplicate rules.
+    """
+    run_nft(
+        "table ip mini_docker {}\n"
+        "flush table ip mini_docker\n"
+        "table ip mini_docker {\n"
+        "\tchain postrouting {\n"
+        "\t\ttype nat hook postrouting priority 100; policy accept;\n"
+        f"\t\tip saddr {subnet} masquerade\n"
+        f'\t\toifname "{BRIDGE_NAME}" masquerade\n'
+        "\t}\n"
+        "}\n"
+    )
+
+
+def _existing_nat_rules() -> str:
+    """Current nat table in iptables-save format, or "" if unreadable."""
+    result = subprocess.run(
+        ["iptables-save", "-t", "nat"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.stdout if result.returncode == 0 else ""
+
+
 def bridge_exists(name: str = BRIDGE_NAME) -> bool:
     """Check if bridge device exists."""
     result = run_ip_command(["link", "show", name], check=False)
@@ -136,25 +331,40 @@ def create_bridge(name: str = BRIDGE_NAME, ip: str = BRIDGE_IP) -> None:
         name: Bridge device name
         ip: IP address to assign to bridge
     """
-    if bridge_exists(name):
-        return
-
-    try:
-        # Create bridge device
-        run_ip_command(["link", "add", "name", name, "type", "bridge"])
+    global _bridge_ready
+    with _ready_lock:
+        if _bridge_ready and name == BRIDGE_NAME:
+            return
 
-        # Assign IP address
-        run_ip_command(["addr", "add", f"{ip}/24", "dev", name])
+        if bridge_exists(name):
+            if name == BRIDGE_NAME:
+                _bridge_ready = True
+            return
 
-        # Bring bridge up
-        run_ip_command(["link", "set", name, "up"])
+        try:
+            # Create the device, assign its IP, and bring it up in one
+            # batch process instead of three
+            run_ip_batch(
+                [
+                    ["link", "add", "name", name, "type", "bridge"],
+                    ["addr", "add", f"{ip}/24", "dev", name],
+                    ["link", "set", name, "up"],
+                ]
+            )
+        except subprocess.CalledProcessError as e:
+            raise NetworkError(f"Failed to create bridge: {e}")
 
-    except subprocess.CalledProcessError as e:
-        raise NetworkError(f"Failed to create bridge: {e}")
+        if name == BRIDGE_NAME:
+            _bridge_ready = True
 
 
 def delete_bridge(name: str = BRIDGE_NAME) -> None:
     """Delete a network bridge."""
+    global _bridge_ready
+    if name == BRIDGE_NAME:
+        with _ready_lock:
+            _bridge_ready = False
+
     if not bridge_exists(name):
         return
 
@@ -165,7 +375,9 @@ def delete_bridge(name: str = BRIDGE_NAME) -> None:
         pass
 
 
-def create_veth_pair(veth_host: str, veth_container: str) -> None:
+def create_veth_pair(
+    veth_host: str, veth_container: str, peer_netns_pid: Optional[int] = None
+) -> None:
     """
     Create a veth (virtual ethernet) pair.
 
@@ -175,11 +387,15 @@ def create_veth_pair(veth_host: str, veth_container: str) -> None:
     Args:
         veth_host: Name for host-side veth
         veth_container: Name for container-side veth
+        peer_netns_pid: If given, create the container side directly in
+                        this process's network namespace, skipping the
+                        separate move step
     """
+    args = ["link", "add", veth_host, "type", "veth", "peer", "name", veth_container]
+    if peer_netns_pid is not None:
+        args += ["netns", str(peer_netns_pid)]
     try:
-        run_ip_command(
-            ["link", "add", veth_host, "type", "veth", "peer", "name", veth_container]
-        )
+        run_ip_command(args)
     except subprocess.CalledProcessError as e:
         raise NetworkError(f"Failed to create veth pair: {e}")
 
@@ -226,8 +442,12 @@ def attach_to_bridge(veth_name: str, bridge: str = BRIDGE_NAME) -> None:
         bridge: Bridge device name
     """
     try:
-        run_ip_command(["link", "set", veth_name, "master", bridge])
-        run_ip_command(["link", "set", veth_name, "up"])
+        run_ip_batch(
+            [
+                ["link", "set", veth_name, "master", bridge],
+                ["link", "set", veth_name, "up"],
+            ]
+        )
     except subprocess.CalledProcessError as e:
         raise NetworkError(f"Failed to attach to bridge: {e}")
 
@@ -350,6 +570,12 @@ def setup_nat(subnet: str = BRIDGE_SUBNET) -> None:
     Args:
         subnet: Source subnet to NAT
     """
+    global _nat_ready
+    if subnet == BRIDGE_SUBNET:
+        with _ready_lock:
+            if _nat_ready:
+                return
+
     # Enable IP forwarding and route_localnet
     try:
         with open("/proc/sys/net/ipv4/ip_forward", "w") as f:
@@ -367,46 +593,60 @@ def setup_nat(subnet: str = BRIDGE_SUBNET) -> None:
     except (IOError, PermissionError):
         pass
 
-    # 1. Outbound NAT rule (MASQUERADE from subnet)
-    check_rule = run_iptables_command(
-        ["-t", "nat", "-C", "POSTROUTING", "-s", subnet, "-j", "MASQUERADE"],
-        check=False,
-    )
-    if check_rule.returncode != 0:
+    # Prefer nftables: the whole NAT ruleset lands in one atomic
+    # NFNETLINK transaction with no table copy or xtables lock
+    if _nft_supported():
         try:
-            run_iptables_command(
-                ["-t", "nat", "-A", "POSTROUTING", "-s", subnet, "-j", "MASQUERADE"]
-            )
-        except subprocess.CalledProcessError as e:
-            raise NetworkError(f"Failed to set up NAT for {subnet}: {e}") from e
+            _setup_nat_nft(subnet)
+            _mark_nat_ready(subnet)
+            return
+        except subprocess.CalledProcessError:
+            # Kernel without nf_tables support; fall back to iptables
+            pass
+
+    # Outbound NAT (MASQUERADE from subnet) and NAT loopback
+    # (MASQUERADE outbound to bridge): read the table once to decide
+    # which rules are missing, then install them in one atomic restore
+    # instead of a -C/-A exec pair per rule
+    wanted = [
+        f"-A POSTROUTING -s {subnet} -j MASQUERADE",
+        f"-A POSTROUTING -o {BRIDGE_NAME} -j MASQUERADE",
+    ]
+    existing = _existing_nat_rules()
+    missing = [rule for rule in wanted if rule not in existing]
+    if not missing:
+        _mark_nat_ready(subnet)
+        return
 
-    # 2. NAT loopback rule (MASQUERADE outbound to bridge)
-    check_loopback = run_iptables_command(
-        ["-t", "nat", "-C", "POSTROUTING", "-o", BRIDGE_NAME, "-j", "MASQUERADE"],
-        check=False,
-    )
-    if check_loopback.returncode != 0:
-        try:
-            run_iptables_command(
-                [
-                    "-t",
-                    "nat",
-                    "-A",
-                    "POSTROUTING",
-                    "-o",
-                    BRIDGE_NAME,
-                    "-j",
-                    "MASQUERADE",
-                ]
-            )
-        except subprocess.CalledProcessError as e:
-            raise NetworkError(
-                f"Failed to set up NAT loopback on {BRIDGE_NAME}: {e}"
-            ) from e
+    blob = "*nat\n" + "\n".join(missing) + "\nCOMMIT\n"
+    try:
+        run_iptables_restore(blob)
+    except subprocess.CalledProcessError as e:
+        raise NetworkError(f"Failed to set up NAT for {subnet}: {e}") from e
+    _mark_nat_ready(subnet)
+
+
+def _mark_nat_ready(subnet: str) -> None:
+    """Record that the default subnet's NAT rules are in place."""
+    global _nat_ready
+    if subnet == BRIDGE_SUBNET:
+        with _ready_lock:
+            _nat_ready = True
 
 
 def remove_nat(subnet: str = BRIDGE_SUBNET) -> None:
     """Remove the Mini-Docker NAT MASQUERADE rules if they exist."""
+    global _nat_ready
+    if subnet == BRIDGE_SUBNET:
+        with _ready_lock:
+            _nat_ready = False
+    if _nft_supported():
+        subprocess.run(
+            ["nft", "delete", "table", "ip", "mini_docker"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
     run_iptables_command(
         ["-t", "nat", "-D", "POSTROUTING", "-s", subnet, "-j", "MASQUERADE"],
         check=False,
@@ -455,29 +695,85 @@ def setup_container_networking(
     veth_host = veth_host[:15]
     veth_container_temp = veth_container_temp[:15]
 
-    # Create veth pair
-    create_veth_pair(veth_host, veth_container_temp)
-
-    # Attach host side to bridge
-    attach_to_bridge(veth_host)
-
-    # Move container side to container's network namespace and rename to eth0
-    move_veth_to_netns(
-        veth_container_temp, container_pid, target_name=veth_container_final
-    )
+    # Fused fast path: one batch process creates the pair with the
+    # container side born inside the target netns under its final name,
+    # enslaves and raises the host side, and flushes stale ARP entries
+    # — a single fork where the step-by-step path costs four
+    try:
+        run_ip_batch(
+            [
+                [
+                    "link",
+                    "add",
+                    veth_host,
+                    "type",
+                    "veth",
+                    "peer",
+                    "name",
+                    veth_container_final,
+                    "netns",
+                    str(container_pid),
+                ],
+                ["link", "set", veth_host, "master", BRIDGE_NAME],
+                ["link", "set", veth_host, "up"],
+                ["neigh", "flush", "dev", BRIDGE_NAME],
+            ]
+        )
+    except subprocess.CalledProcessError:
+        # Older kernels reject a netns on the peer attribute, which
+        # aborts the whole batch; clear any half-made pair and redo the
+        # sequence step by step with a host-side create + move
+        delete_veth(veth_host)
+        create_veth_pair(veth_host, veth_container_temp)
+        attach_to_bridge(veth_host)
+        move_veth_to_netns(
+            veth_container_temp, container_pid, target_name=veth_container_final
+        )
+        run_ip_command(["neigh", "flush", "dev", BRIDGE_NAME], check=False)
 
-    # After moving, we refer to it as the final name inside the container
+    # Inside the container the interface carries the final name
     veth_container = veth_container_final
 
     # Set up NAT
     setup_nat()
 
-    # Flush ARP cache on the bridge to prevent stale mappings
-    run_ip_command(["neigh", "flush", "dev", BRIDGE_NAME], check=False)
-
     return veth_host, veth_container, ip_address
 
 
+# Bounds how many containers' network bring-ups run at once through the
+# async path; acquired in the worker thread so it is event-loop agnostic
+_ASYNC_SETUP_LIMIT = threading.Semaphore(os.cpu_count() or 1)
+
+
+async def setup_container_networking_async(
+    container_id: str, container_pid: int, ip_address: Optional[str] = None
+) -> Tuple[str, str, str]:
+    """
+    Async wrapper around setup_container_networking.
+
+    Several containers' bring-ups can be awaited concurrently with
+    asyncio.gather; each runs in a worker thread (the underlying work
+    is subprocess- and syscall-bound, so threads overlap it fine) with
+    a CPU-count semaphore bounding the fan-out. The readiness caches
+    and lock in this module keep the shared bridge/NAT steps from
+    racing.
+
+    Args:
+        container_id: Container ID (used for interface naming)
+        container_pid: PID of container init process
+        ip_address: IP to assign (auto-assigned if None)
+
+    Returns:
+        Tuple of (veth_host, veth_container, ip_address)
+    """
+
+    def _run() -> Tuple[str, str, str]:
+        with _ASYNC_SETUP_LIMIT:
+            return setup_container_networking(container_id, container_pid, ip_address)
+
+    return await asyncio.to_thread(_run)
+
+
 def configure_container_network(ip_address: str, gateway: str = BRIDGE_IP) -> None:
     """
     Configure networking inside the container.
@@ -489,16 +785,16 @@ def configure_container_network(ip_address: str, gateway: str = BRIDGE_IP) -> No
         gateway: Default gateway (bridge IP)
     """
     try:
-        # Bring up loopback
-        run_ip_command(["link", "set", "lo", "up"])
-
-        # Configure eth0
-        run_ip_command(["addr", "add", f"{ip_address}/24", "dev", "eth0"])
-        run_ip_command(["link", "set", "eth0", "up"])
-
-        # Add default route
-        run_ip_command(["route", "add", "default", "via", gateway])
-
+        # Loopback, eth0 address, link state, and default route in one
+        # batch process instead of four
+        run_ip_batch(
+            [
+                ["link", "set", "lo", "up"],
+                ["addr", "add", f"{ip_address}/24", "dev", "eth0"],
+                ["link", "set", "eth0", "up"],
+                ["route", "add", "default", "via", gateway],
+            ]
+        )
     except subprocess.CalledProcessError as e:
         raise NetworkError(f"Failed to configure container network: {e}")
 
@@ -511,11 +807,17 @@ def cleanup_container_networking(container_id: str) -> None:
         container_id: Container ID
     """
     short_id = container_id[:8]
-    veth_host = f"veth{short_id}"[:15]
-    delete_veth(veth_host)
-    # Try alternate naming patterns
-    delete_veth(f"veth-{short_id}"[:15])
-    run_ip_command(["neigh", "flush", "dev", BRIDGE_NAME], check=False)
+    # Both candidate names plus the ARP flush go through one forced
+    # batch: a single fork, and a missing interface (the usual case for
+    # the alternate spelling) doesn't stop the remaining commands
+    run_ip_batch(
+        [
+            ["link", "delete", f"veth{short_id}"[:15]],
+            ["link", "delete", f"veth-{short_id}"[:15]],
+            ["neigh", "flush", "dev", BRIDGE_NAME],
+        ],
+        force=True,
+    )
 
 
 class Network:
@@ -556,6 +858,27 @@ class Network:
         )
         return self.veth_host, self.veth_container, self.ip_address
 
+    async def setup_async(
+        self, container_pid: int, ip: Optional[str] = None
+    ) -> Tuple[str, str, str]:
+        """
+        Async variant of setup, for concurrent multi-container launch.
+
+        Args:
+            container_pid: PID of container's init process
+            ip: Optional specific IP address
+
+        Returns:
+            Tuple of (veth_host, veth_container, ip_address)
+        """
+        self._setup_called = True
+        self.veth_host, self.veth_container, self.ip_address = (
+            await setup_container_networking_async(
+                self.container_id, container_pid, ip
+            )
+        )
+        return self.veth_host, self.veth_container, self.ip_address
+
     def configure_inside(self) -> None:
         """Configure networking from inside the container."""
         if self.ip_address:
@@ -566,6 +889,9 @@ class Network:
         if self.veth_host:
             delete_veth(self.veth_host)
         cleanup_container_networking(self.container_id)
+        if self.ip_address:
+            release_ip(self.ip_address)
+            self.ip_address = None
 
     def get_info(self) -> dict:
         """Get network information."""
@@ -22,13 +22,19 @@ The config.json follows the OCI runtime-spec format:
 
 import json
 import os
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, List, Optional
 
 from mini_docker.metadata import ContainerConfig, NetworkConfig, ResourceLimits
 
+# Slotted dataclasses skip the per-instance __dict__ (smaller objects,
+# C-speed attribute reads during config traversal); the slots flag only
+# exists on Python 3.10+, so older interpreters get plain dataclasses
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class OCIProcess:
     """OCI Process configuration."""
 
@@ -46,7 +52,7 @@ class OCIProcess:
     noNewPrivileges: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OCIRoot:
     """OCI Root filesystem configuration."""
 
@@ -54,7 +60,7 @@ class OCIRoot:
     readonly: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OCIMount:
     """OCI Mount configuration."""
 
@@ -64,7 +70,7 @@ class OCIMount:
     options: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OCINamespace:
     """OCI Linux namespace configuration."""
 
@@ -72,7 +78,7 @@ class OCINamespace:
     path: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OCILinuxResources:
     """OCI Linux resource limits."""
 
@@ -81,7 +87,7 @@ class OCILinuxResources:
     pids: Dict[str, int] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OCILinux:
     """OCI Linux-specific configuration."""
 
@@ -92,7 +98,7 @@ class OCILinux:
     readonlyPaths: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OCIConfig:
     """Complete OCI runtime configuration."""
 
@@ -104,18 +110,52 @@ class OCIConfig:
     linux: OCILinux = field(default_factory=OCILinux)
 
 
+# Field-name sets computed once so parsing can unpack config.json
+# sections straight into the dataclasses, keeping their declared
+# defaults, instead of walking every field with .get()
+_PROCESS_FIELDS = frozenset(f.name for f in fields(OCIProcess))
+_ROOT_FIELDS = frozenset(f.name for f in fields(OCIRoot))
+_MOUNT_FIELDS = frozenset(f.name for f in fields(OCIMount))
+_NAMESPACE_FIELDS = frozenset(f.name for f in fields(OCINamespace))
+_RESOURCES_FIELDS = frozenset(f.name for f in fields(OCILinuxResources))
+
+
+# Namespace-name translation tables, OCI spec names on one side and the
+# runtime's short names on the other; built once at import
+_NS_OCI_TO_INTERNAL = {
+    "pid": "pid",
+    "network": "net",
+    "mount": "mnt",
+    "ipc": "ipc",
+    "uts": "uts",
+    "user": "user",
+    "cgroup": "cgroup",
+}
+_NS_INTERNAL_TO_OCI = {v: k for k, v in _NS_OCI_TO_INTERNAL.items()}
+
+
 class OCIError(Exception):
     """Exception raised for OCI operations."""
 
     pass
 
 
-def load_oci_config(bundle_path: str) -> OCIConfig:
+# Parsed-config cache keyed by (path, mtime_ns, size): bundle loads hit
+# disk and the parser once, and validate/load/convert sequences on the
+# same unchanged config.json reuse the parsed object
+_OCI_CACHE: Dict[tuple, OCIConfig] = {}
+_OCI_CACHE_MAX = 256
+
+
+def load_oci_config(bundle_path: str, full: bool = True) -> OCIConfig:
     """
     Load OCI config.json from a bundle.
 
     Args:
         bundle_path: Path to OCI bundle directory
+        full: When False, skip materializing sections the
+              container-config conversion never reads (currently the
+              mounts list), saving their object construction
 
     Returns:
         OCIConfig instance
@@ -125,24 +165,58 @@ def load_oci_config(bundle_path: str) -> OCIConfig:
     """
     config_path = os.path.join(bundle_path, "config.json")
 
-    if not os.path.exists(config_path):
+    try:
+        st = os.stat(config_path)
+    except OSError:
         raise OCIError(f"config.json not found in bundle: {bundle_path}")
 
+    key = (config_path, st.st_mtime_ns, st.st_size, full)
+    cached = _OCI_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # Raw fd read sized from the stat above: one read covers the file,
+    # the bytes go straight to the JSON parser, and the text-IO layer's
+    # decoder and buffering are skipped entirely
+    fd = os.open(config_path, os.O_RDONLY)
+    try:
+        raw = os.read(fd, st.st_size + 1)
+        if len(raw) > st.st_size:
+            # The file grew between stat and read; drain the rest
+            chunks = [raw]
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            raw = b"".join(chunks)
+    finally:
+        os.close(fd)
+
     try:
-        with open(config_path, "r") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         raise OCIError(f"Invalid JSON in config.json: {e}")
 
-    return parse_oci_config(data)
+    config = parse_oci_config(data, full=full)
 
+    if len(_OCI_CACHE) >= _OCI_CACHE_MAX:
+        # Simple FIFO eviction; bundle churn past 256 entries is not a
+        # case worth an LRU's bookkeeping here
+        _OCI_CACHE.pop(next(iter(_OCI_CACHE)))
+    _OCI_CACHE[key] = config
 
-def parse_oci_config(data: Dict) -> OCIConfig:
+    return config
+
+
+def parse_oci_config(data: Dict, full: bool = True) -> OCIConfig:
     """
     Parse OCI config dictionary into OCIConfig dataclass.
 
     Args:
         data: Dictionary from config.json
+        full: When False, leave the mounts list empty instead of
+              building an OCIMount per entry
 
     Returns:
         OCIConfig instance
@@ -152,59 +226,39 @@ def parse_oci_config(data: Dict) -> OCIConfig:
     config.ociVersion = data.get("ociVersion", "1.0.0")
     config.hostname = data.get("hostname", "")
 
-    # Parse process
-    if "process" in data:
-        proc = data["process"]
+    # Each section unpacks the keys it declares directly into its
+    # dataclass; unknown keys are dropped and missing ones keep the
+    # dataclass defaults, same as the old field-by-field walk
+    proc = data.get("process")
+    if proc is not None:
         config.process = OCIProcess(
-            terminal=proc.get("terminal", False),
-            user=proc.get("user", {"uid": 0, "gid": 0}),
-            args=proc.get("args", []),
-            env=proc.get("env", []),
-            cwd=proc.get("cwd", "/"),
-            capabilities=proc.get("capabilities", {}),
-            rlimits=proc.get("rlimits", []),
-            noNewPrivileges=proc.get("noNewPrivileges", True),
+            **{k: proc[k] for k in _PROCESS_FIELDS & proc.keys()}
         )
 
-    # Parse root
-    if "root" in data:
-        root = data["root"]
-        config.root = OCIRoot(
-            path=root.get("path", "rootfs"),
-            readonly=root.get("readonly", False),
-        )
+    root = data.get("root")
+    if root is not None:
+        config.root = OCIRoot(**{k: root[k] for k in _ROOT_FIELDS & root.keys()})
 
-    # Parse mounts
-    if "mounts" in data:
+    mounts = data.get("mounts")
+    if full and mounts is not None:
         config.mounts = [
-            OCIMount(
-                destination=m.get("destination", ""),
-                type=m.get("type", ""),
-                source=m.get("source", ""),
-                options=m.get("options", []),
-            )
-            for m in data["mounts"]
+            OCIMount(**{k: m[k] for k in _MOUNT_FIELDS & m.keys()}) for m in mounts
         ]
 
-    # Parse linux
-    if "linux" in data:
-        linux = data["linux"]
-
-        namespaces = []
-        for ns in linux.get("namespaces", []):
-            namespaces.append(
-                OCINamespace(
-                    type=ns.get("type", ""),
-                    path=ns.get("path"),
-                )
-            )
+    linux = data.get("linux")
+    if linux is not None:
+        namespaces = [
+            OCINamespace(**{k: ns[k] for k in _NAMESPACE_FIELDS & ns.keys()})
+            for ns in linux.get("namespaces", [])
+        ]
 
-        resources = OCILinuxResources()
-        if "resources" in linux:
-            res = linux["resources"]
-            resources.memory = res.get("memory", {})
-            resources.cpu = res.get("cpu", {})
-            resources.pids = res.get("pids", {})
+        res = linux.get("resources")
+        if res is not None:
+            resources = OCILinuxResources(
+                **{k: res[k] for k in _RESOURCES_FIELDS & res.keys()}
+            )
+        else:
+            resources = OCILinuxResources()
 
         config.linux = OCILinux(
             namespaces=namespaces,
@@ -233,12 +287,13 @@ def oci_to_container_config(oci_config: OCIConfig, bundle_path: str) -> Containe
     if not os.path.isabs(rootfs):
         rootfs = os.path.abspath(rootfs)
 
-    # Parse environment variables
-    env = {}
-    for e in oci_config.process.env:
-        if "=" in e:
-            key, value = e.split("=", 1)
-            env[key] = value
+    # Parse environment variables: partition scans each entry once,
+    # where the membership test plus split scanned it twice
+    env = {
+        key: value
+        for key, sep, value in (e.partition("=") for e in oci_config.process.env)
+        if sep
+    }
 
     # Parse resource limits
     resources = ResourceLimits()
@@ -261,20 +316,11 @@ def oci_to_container_config(oci_config: OCIConfig, bundle_path: str) -> Containe
             resources.max_pids = pids["limit"]
 
     # Parse namespaces
-    namespaces = []
-    ns_type_map = {
-        "pid": "pid",
-        "network": "net",
-        "mount": "mnt",
-        "ipc": "ipc",
-        "uts": "uts",
-        "user": "user",
-        "cgroup": "cgroup",
-    }
-
-    for ns in oci_config.linux.namespaces:
-        if ns.type in ns_type_map:
-            namespaces.append(ns_type_map[ns.type])
+    namespaces = [
+        _NS_OCI_TO_INTERNAL[ns.type]
+        for ns in oci_config.linux.namespaces
+        if ns.type in _NS_OCI_TO_INTERNAL
+    ]
 
     # Parse capabilities
     caps = []
@@ -318,15 +364,9 @@ def generate_oci_config(config: ContainerConfig) -> Dict:
         env_list = ["PATH=/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin"]
 
     # Build namespaces list
-    ns_map = {
-        "pid": "pid",
-        "net": "network",
-        "mnt": "mount",
-        "ipc": "ipc",
-        "uts": "uts",
-        "user": "user",
-    }
-    namespaces = [{"type": ns_map.get(ns, ns)} for ns in config.namespaces]
+    namespaces = [
+        {"type": _NS_INTERNAL_TO_OCI.get(ns, ns)} for ns in config.namespaces
+    ]
 
     # Build resources
     resources = {}
@@ -389,6 +429,25 @@ def generate_oci_config(config: ContainerConfig) -> Dict:
     return oci_config
 
 
+def dumps_oci_config(config: ContainerConfig) -> bytes:
+    """
+    Serialize a ContainerConfig as OCI config.json bytes.
+
+    One compact single-pass encode: no pretty-printing whitespace and
+    no intermediate str, so the result can go straight to a file or
+    socket write.
+
+    Args:
+        config: ContainerConfig instance
+
+    Returns:
+        UTF-8 encoded config.json content
+    """
+    return json.dumps(generate_oci_config(config), separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
 def validate_bundle(bundle_path: str) -> List[str]:
     """
     Validate an OCI bundle.
@@ -399,33 +458,65 @@ def validate_bundle(bundle_path: str) -> List[str]:
     Returns:
         List of validation errors (empty if valid)
     """
+    errors, _ = validate_and_load_bundle(bundle_path)
+    return errors
+
+
+def validate_and_load_bundle(
+    bundle_path: str,
+) -> "tuple[List[str], Optional[OCIConfig]]":
+    """
+    Validate an OCI bundle and hand back the config parsed on the way.
+
+    Validation already has to load config.json; returning it lets the
+    validate-then-load call pattern parse the bundle once.
+
+    Args:
+        bundle_path: Path to OCI bundle
+
+    Returns:
+        Tuple of (validation errors, parsed config or None)
+    """
     errors = []
 
-    if not os.path.isdir(bundle_path):
+    # One directory scan answers the bundle-is-a-directory, config.json,
+    # and (usually) rootfs checks; DirEntry type checks come from the
+    # readdir d_type instead of a stat per path
+    try:
+        with os.scandir(bundle_path) as it:
+            entries = {entry.name: entry for entry in it}
+    except (NotADirectoryError, FileNotFoundError):
         errors.append(f"Bundle path is not a directory: {bundle_path}")
-        return errors
+        return errors, None
 
-    config_path = os.path.join(bundle_path, "config.json")
-    if not os.path.exists(config_path):
+    config_entry = entries.get("config.json")
+    if config_entry is None or not config_entry.is_file():
         errors.append("config.json not found in bundle")
-        return errors
+        return errors, None
 
     try:
         oci_config = load_oci_config(bundle_path)
     except OCIError as e:
         errors.append(str(e))
-        return errors
-
-    # Check rootfs exists
-    rootfs_path = os.path.join(bundle_path, oci_config.root.path)
-    if not os.path.isdir(rootfs_path):
+        return errors, None
+
+    # Check rootfs exists; a plain relative name resolves against the
+    # scanned entries, anything nested or absolute falls back to stat
+    root_path = oci_config.root.path
+    rootfs_path = os.path.join(bundle_path, root_path)
+    if not os.path.isabs(root_path) and "/" not in root_path:
+        root_entry = entries.get(root_path)
+        rootfs_ok = root_entry is not None and root_entry.is_dir()
+    else:
+        rootfs_ok = os.path.isdir(rootfs_path)
+    if not rootfs_ok:
         errors.append(f"Root filesystem not found: {rootfs_path}")
 
     # Check process has args
     if not oci_config.process.args:
         errors.append("Process args not specified")
 
-    return errors
+    return errors, oci_config
 
 
 class OCIRuntime:
@@ -440,12 +531,23 @@ class OCIRuntime:
             container_config = runtime.to_container_config(config, "/path/to/bundle")
     """
 
+    def __init__(self):
+        # Config parsed by the last successful validate(), so the
+        # validate-then-load pattern parses the bundle once
+        self._last_validated: Optional[tuple] = None
+
     def validate(self, bundle_path: str) -> List[str]:
         """Validate an OCI bundle."""
-        return validate_bundle(bundle_path)
+        errors, oci_config = validate_and_load_bundle(bundle_path)
+        self._last_validated = (
+            (bundle_path, oci_config) if oci_config is not None else None
+        )
+        return errors
 
     def load(self, bundle_path: str) -> OCIConfig:
         """Load OCI configuration from bundle."""
+        if self._last_validated is not None and self._last_validated[0] == bundle_path:
+            return self._last_validated[1]
         return load_oci_config(bundle_path)
 
     def to_container_config(
@@ -457,3 +559,7 @@ class OCIRuntime:
     def generate(self, config: ContainerConfig) -> Dict:
         """Generate OCI config.json from container config."""
         return generate_oci_config(config)
+
+    def dumps(self, config: ContainerConfig) -> bytes:
+        """Generate and serialize OCI config.json in one call."""
+        return dumps_oci_config(config)
@@ -5,10 +5,11 @@ Pod support for Mini-Docker.
 
 import json
 import os
-import signal
+import sys
 import time
-from dataclasses import asdict, dataclass, field
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
 
 from mini_docker.utils import (
     PODS_PATH,
@@ -25,7 +26,12 @@ class PodError(Exception):
     pass
 
 
-@dataclass
+# slots=True needs Python 3.10; older interpreters keep the plain
+# __dict__ layout (the project floor is 3.8)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class PodConfig:
     """Pod configuration."""
 
@@ -58,6 +64,21 @@ class PodConfig:
                 ns for ns in self.shared_namespaces if ns != "net"
             ]
 
+    def to_dict(self) -> Dict:
+        """Serialize to JSON-native types without asdict's deepcopy."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "containers": list(self.containers),
+            "infra_pid": self.infra_pid,
+            "ip_address": self.ip_address,
+            "shared_namespaces": list(self.shared_namespaces),
+            "hostname": self.hostname,
+            "network": self.network,
+            "status": self.status,
+            "created_at": self.created_at,
+        }
+
 
 def get_pod_path(pod_id: str) -> str:
     """Get path to pod directory."""
@@ -68,22 +89,126 @@ def _pod_config_path(pod_id: str) -> str:
     return os.path.join(get_pod_path(pod_id), "config.json")
 
 
+# Cached scandir pass: (pods path, dir mtime_ns, {pod id -> stat}).
+# Keyed on the path so a repointed PODS_PATH never serves stale names,
+# and validated against the directory's mtime on every lookup so a
+# long-running daemon sees pods created or removed by other processes
+# (a CLI create touches the directory's mtime); the stat that checks
+# freshness is one syscall against a full rescan. Save/delete still
+# invalidate eagerly within the process
+_DIR_SCAN: Optional[tuple] = None
+
+
+def _scan_pods_dir() -> Dict[str, os.stat_result]:
+    global _DIR_SCAN
+
+    try:
+        dir_mtime_ns = os.stat(PODS_PATH).st_mtime_ns
+    except OSError:
+        _DIR_SCAN = None
+        return {}
+
+    if (
+        _DIR_SCAN is not None
+        and _DIR_SCAN[0] == PODS_PATH
+        and _DIR_SCAN[1] == dir_mtime_ns
+    ):
+        return _DIR_SCAN[2]
+
+    scan: Dict[str, os.stat_result] = {}
+    try:
+        with os.scandir(PODS_PATH) as entries:
+            for entry in entries:
+                # DirEntry carries the type from getdents; the stat
+                # comes from the same pass and is reused by callers
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        scan[entry.name] = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+    except FileNotFoundError:
+        pass
+
+    _DIR_SCAN = (PODS_PATH, dir_mtime_ns, scan)
+    return scan
+
+
+def _invalidate_dir_scan() -> None:
+    global _DIR_SCAN
+    _DIR_SCAN = None
+
+
 def _list_pod_ids() -> List[str]:
-    if not os.path.exists(PODS_PATH):
-        return []
-    return sorted(os.listdir(PODS_PATH))
+    return sorted(_scan_pods_dir())
+
+
+# Parsed pod-config cache: pod id -> (mtime_ns, size, parsed dict).
+# The stat that validates an entry replaces the old existence check, so
+# a cache hit costs one syscall and no JSON parse
+_POD_CACHE: Dict[str, tuple] = {}
+
+
+def _copy_pod_data(data: Dict) -> Dict:
+    """
+    Copy a cached pod dict so callers cannot mutate the cache entry.
+
+    The list-valued fields need their own copies: handing out aliased
+    lists lets an in-place append leak into the cache, and
+    save_pod_config's skip-if-unchanged comparison would then see the
+    caller's own edit already "cached" and drop the write
+    """
+    copied = dict(data)
+    containers = copied.get("containers")
+    if isinstance(containers, list):
+        copied["containers"] = list(containers)
+    namespaces = copied.get("shared_namespaces")
+    if isinstance(namespaces, list):
+        copied["shared_namespaces"] = list(namespaces)
+    return copied
 
 
 def _read_pod_data(pod_id: str) -> Optional[Dict]:
     config_path = _pod_config_path(pod_id)
-    if not os.path.exists(config_path):
+
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        _POD_CACHE.pop(pod_id, None)
         return None
 
+    cached = _POD_CACHE.get(pod_id)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return _copy_pod_data(cached[2])
+
+    # One open, one read of the size the stat above already gave us,
+    # one close; O_CLOEXEC keeps the fd out of forked infra processes.
+    # Reading st_size + 1 detects a file grown since the stat
     try:
-        with open(config_path, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        fd = os.open(config_path, os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
         return None
+    try:
+        raw = os.read(fd, st.st_size + 1)
+        if len(raw) > st.st_size:
+            chunks = [raw]
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            raw = b"".join(chunks)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+    _POD_CACHE[pod_id] = (st.st_mtime_ns, st.st_size, data)
+    return _copy_pod_data(data)
 
 
 def _refresh_pod_state(config: PodConfig) -> PodConfig:
@@ -102,6 +227,18 @@ def _load_pod_config_by_id(
     if not data:
         return None
 
+    # JSON parsing allocates a fresh string per document even for
+    # values repeated across every config ("running", "net", ...);
+    # interning shares one object and makes comparisons pointer checks
+    status = data.get("status")
+    if isinstance(status, str):
+        data["status"] = sys.intern(status)
+    namespaces = data.get("shared_namespaces")
+    if isinstance(namespaces, list):
+        data["shared_namespaces"] = [
+            sys.intern(ns) if isinstance(ns, str) else ns for ns in namespaces
+        ]
+
     try:
         config = PodConfig(**data)
     except TypeError:
@@ -115,7 +252,7 @@ def _load_pod_config_by_id(
 
 def pod_exists(pod_id: str) -> bool:
     """Check if pod exists."""
-    return os.path.exists(_pod_config_path(pod_id))
+    return pod_id in _scan_pods_dir()
 
 
 def save_pod_config(config: PodConfig) -> str:
@@ -126,8 +263,40 @@ def save_pod_config(config: PodConfig) -> str:
     os.makedirs(pod_path, exist_ok=True)
 
     config_path = _pod_config_path(config.id)
-    with open(config_path, "w") as f:
-        json.dump(asdict(config), f, indent=2)
+    data = config.to_dict()
+
+    # Idempotent saves (reconcile loops, state refreshes that changed
+    # nothing) skip the write, fsync, and cache invalidation entirely;
+    # the stat confirms the on-disk file still matches the cache
+    cached = _POD_CACHE.get(config.id)
+    if cached is not None and cached[2] == data:
+        try:
+            st = os.stat(config_path)
+            if st.st_mtime_ns == cached[0] and st.st_size == cached[1]:
+                return config_path
+        except OSError:
+            pass
+
+    # Encode once to compact bytes and write in a single syscall; the
+    # pretty-printing indent only padded a machine-read file
+    payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    # Write to a temp file and rename over the config: the rename is
+    # atomic, so a concurrent reader sees the old or the new document
+    # but never a torn one, and the mtime cache token stays trustworthy
+    tmp_path = f"{config_path}.tmp.{os.getpid()}"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+        st = os.fstat(fd)
+    finally:
+        os.close(fd)
+    os.rename(tmp_path, config_path)
+
+    # Write-through so the next read validates against the fresh stat
+    _POD_CACHE[config.id] = (st.st_mtime_ns, st.st_size, data)
+    _invalidate_dir_scan()
 
     return config_path
 
@@ -142,39 +311,136 @@ def load_pod_config(pod_id: str) -> Optional[PodConfig]:
 
 def delete_pod_config(pod_id: str) -> bool:
     """Delete pod configuration."""
-    import shutil
-
     full_id = find_pod_id(pod_id)
     if not full_id:
         return False
 
     config = _load_pod_config_by_id(full_id, refresh_state=False)
     if config and config.infra_pid:
-        try:
-            os.kill(config.infra_pid, signal.SIGTERM)
-            time.sleep(0.5)
-            os.kill(config.infra_pid, signal.SIGKILL)
-        except OSError:
-            pass
+        _terminate_infra_process(config.infra_pid)
+
+    _POD_CACHE.pop(full_id, None)
+    _invalidate_dir_scan()
+    pod_path = get_pod_path(full_id)
 
+    # A pod directory normally holds just config.json, so unlink+rmdir
+    # covers it without rmtree's listdir/stat/recurse walk; any extra
+    # entries fail the rmdir and fall through to the full removal
     try:
-        shutil.rmtree(get_pod_path(full_id))
+        os.unlink(_pod_config_path(full_id))
+    except OSError:
+        pass
+    try:
+        os.rmdir(pod_path)
+        return True
+    except OSError:
+        pass
+
+    try:
+        import shutil
+
+        shutil.rmtree(pod_path)
         return True
     except (OSError, IOError):
         return False
 
 
-def list_pods() -> List[PodConfig]:
-    """List all pods."""
+def _terminate_infra_process(pid: int) -> None:
+    """
+    Stop an infra process, escalating from SIGTERM to SIGKILL.
+
+    When pidfds are available the signals go through one, so a recycled
+    PID can never catch the escalation SIGKILL, and the fd turning
+    readable replaces the fixed half-second sleep as the exit signal.
+    """
+    import select
+    import signal
+
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is not None:
+        try:
+            pidfd = pidfd_open(pid, 0)
+        except OSError:
+            return
+
+        try:
+            signal.pidfd_send_signal(pidfd, signal.SIGTERM)
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            if not poller.poll(500):
+                signal.pidfd_send_signal(pidfd, signal.SIGKILL)
+        except OSError:
+            pass
+        finally:
+            os.close(pidfd)
+        _reap(pid)
+        return
+
+    try:
+        os.kill(pid, signal.SIGTERM)
+        time.sleep(0.5)
+        os.kill(pid, signal.SIGKILL)
+    except OSError:
+        pass
+    _reap(pid)
+
+
+def _reap(pid: int) -> None:
+    """Collect a dead child so it does not linger as a zombie.
+
+    Pod deletion may run in a process that never forked the infra
+    process (e.g. a fresh CLI invocation), in which case waitpid
+    raises ChildProcessError and there is nothing to collect.
+    """
+    try:
+        os.waitpid(pid, 0)
+    except (ChildProcessError, OSError):
+        pass
+
+
+def iter_pods() -> Iterator[PodConfig]:
+    """Yield pods one at a time in directory order.
+
+    Loads configs lazily, so a caller that stops early never pays for
+    the rest of the pods directory.
+    """
     ensure_directories()
 
-    pods = []
     for pod_id in _list_pod_ids():
         config = _load_pod_config_by_id(pod_id)
         if config:
-            pods.append(config)
+            yield config
+
 
+def list_pods(
+    limit: Optional[int] = None, sort: bool = True
+) -> List[PodConfig]:
+    """List pods, newest first by default.
+
+    With sort=False and a limit, only the first `limit` configs are
+    ever read; sorting requires loading everything first.
+    """
+    if not sort:
+        return list(islice(iter_pods(), limit))
+
+    ensure_directories()
+
+    pod_ids = _list_pod_ids()
+    if len(pod_ids) <= 1:
+        configs = [_load_pod_config_by_id(pod_id) for pod_id in pod_ids]
+    else:
+        # Each load is a latency-bound open+read of a tiny file; a
+        # thread pool overlaps those waits (the GIL is released for
+        # the I/O itself)
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(32, len(pod_ids))) as executor:
+            configs = list(executor.map(_load_pod_config_by_id, pod_ids))
+
+    pods = [config for config in configs if config]
     pods.sort(key=lambda p: p.created_at, reverse=True)
+    if limit is not None:
+        del pods[limit:]
     return pods
 
 
@@ -183,9 +449,9 @@ def find_pod_id(prefix: str) -> Optional[str]:
     if not prefix:
         return None
 
-    if pod_exists(prefix):
-        return prefix
-
+    # First pass works purely on directory names (an exact id is just a
+    # prefix match of itself); only the name-resolution pass pays for
+    # reading configs
     pod_ids = _list_pod_ids()
 
     for pod_id in pod_ids:
@@ -200,8 +466,13 @@ def find_pod_id(prefix: str) -> Optional[str]:
     return None
 
 
-def add_container_to_pod(pod_id: str, container_id: str) -> bool:
-    """Add a container to a pod."""
+def add_containers_to_pod(pod_id: str, container_ids: List[str]) -> bool:
+    """Add several containers to a pod with one load and one write.
+
+    Attaching N containers through the single-item call costs N
+    load/serialize/fsync round trips; batching them amortizes that to
+    one.
+    """
     full_id = find_pod_id(pod_id)
     if not full_id:
         return False
@@ -210,13 +481,27 @@ def add_container_to_pod(pod_id: str, container_id: str) -> bool:
     if not config:
         return False
 
-    if container_id not in config.containers:
-        config.containers.append(container_id)
+    # Membership through a set keeps repeated adds linear rather than
+    # quadratic for pods with many sidecars
+    existing = set(config.containers)
+    added = False
+    for container_id in container_ids:
+        if container_id not in existing:
+            existing.add(container_id)
+            config.containers.append(container_id)
+            added = True
+
+    if added:
         save_pod_config(config)
 
     return True
 
 
+def add_container_to_pod(pod_id: str, container_id: str) -> bool:
+    """Add a container to a pod."""
+    return add_containers_to_pod(pod_id, [container_id])
+
+
 def remove_container_from_pod(pod_id: str, container_id: str) -> bool:
     """Remove a container from a pod."""
     full_id = find_pod_id(pod_id)
@@ -227,8 +512,10 @@ def remove_container_from_pod(pod_id: str, container_id: str) -> bool:
     if not config:
         return False
 
-    if container_id in config.containers:
-        config.containers.remove(container_id)
+    if container_id in set(config.containers):
+        config.containers = [
+            c for c in config.containers if c != container_id
+        ]
         save_pod_config(config)
 
     return True
@@ -239,6 +526,10 @@ class PodManager:
 
     def __init__(self):
         ensure_directories()
+        # pidfds for infra processes this manager forked, keyed by pod
+        # id; liveness checks poll the fd instead of kill(pid, 0) and
+        # are immune to PID reuse. Not serialized with the config.
+        self._infra_pidfds: Dict[str, int] = {}
 
     def create(self, name: Optional[str] = None, **kwargs) -> PodConfig:
         config = PodConfig(name=name or "", **kwargs)
@@ -261,6 +552,19 @@ class PodManager:
                     except Exception:
                         pass
 
+                # Exec a tiny native sleeper so the child sheds the
+                # interpreter heap; a forked Python child keeps tens
+                # of MB of copy-on-write pages alive per pod. The
+                # numeric argument works where "infinity" does not
+                # (busybox)
+                import shutil
+
+                sleep_bin = shutil.which("sleep") or "/bin/sleep"
+                try:
+                    os.execv(sleep_bin, [sleep_bin, "2147483647"])
+                except OSError:
+                    pass
+
                 while True:
                     time.sleep(3600)
             except Exception:
@@ -269,6 +573,10 @@ class PodManager:
             config.infra_pid = pid
             config.status = "running"
             save_pod_config(config)
+            try:
+                self._infra_pidfds[config.id] = os.pidfd_open(pid)
+            except (AttributeError, OSError):
+                pass
 
     def get(self, pod_id: str) -> Optional[PodConfig]:
         return load_pod_config(pod_id)
@@ -277,7 +585,13 @@ class PodManager:
         save_pod_config(config)
 
     def delete(self, pod_id: str, force: bool = False) -> bool:
-        config = load_pod_config(pod_id)
+        # Resolve the prefix/name once; the config load and the delete
+        # both work on the full id afterwards
+        full_id = find_pod_id(pod_id)
+        if not full_id:
+            return False
+
+        config = _load_pod_config_by_id(full_id)
         if not config:
             return False
 
@@ -286,14 +600,19 @@ class PodManager:
                 f"Pod has {len(config.containers)} containers. Use --force to remove."
             )
 
-        return delete_pod_config(pod_id)
+        return delete_pod_config(full_id)
 
-    def list(self) -> List[PodConfig]:
-        return list_pods()
+    def list(
+        self, limit: Optional[int] = None, sort: bool = True
+    ) -> List[PodConfig]:
+        return list_pods(limit=limit, sort=sort)
 
     def add_container(self, pod_id: str, container_id: str) -> bool:
         return add_container_to_pod(pod_id, container_id)
 
+    def add_containers(self, pod_id: str, container_ids: List[str]) -> bool:
+        return add_containers_to_pod(pod_id, container_ids)
+
     def remove_container(self, pod_id: str, container_id: str) -> bool:
         return remove_container_from_pod(pod_id, container_id)
 
@@ -310,6 +629,18 @@ class PodManager:
         if not config or not config.infra_pid:
             return {}
 
+        # A readable pidfd means the infra process already exited; its
+        # namespace paths would point at a dead (or recycled) PID
+        pidfd = self._infra_pidfds.get(config.id)
+        if pidfd is not None:
+            import select
+
+            ready, _, _ = select.select([pidfd], [], [], 0)
+            if ready:
+                os.close(pidfd)
+                del self._infra_pidfds[config.id]
+                return {}
+
         paths = {}
         for ns in config.shared_namespaces:
             ns_path = f"/proc/{config.infra_pid}/ns/{ns}"
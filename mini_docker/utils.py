@@ -29,7 +29,7 @@ Mini-Docker uses a two-part identification system for containers:
 
 Naming Algorithm:
     def generate_container_id():
-        return random.choices('0123456789abcdef', k=12)
+        return os.urandom(6).hex()  # kernel CSPRNG, [0-9a-f]{12}
 
     def generate_container_name():
         adjective = random.choice(ADJECTIVES)  # ~115 options
@@ -44,12 +44,14 @@ Usage Examples:
 
 import ctypes
 import ctypes.util
+import json
 import os
 import random
-import secrets
+import re
 import struct
 import tempfile
-from typing import Optional, Tuple
+import threading
+from typing import List, Optional, Set, Tuple
 
 
 def _get_effective_uid() -> Optional[int]:
@@ -63,43 +65,47 @@ def _get_effective_uid() -> Optional[int]:
     return None
 
 
+# Sampled once so the path decisions below share a single geteuid
+# syscall. The path constants therefore reflect the effective UID at
+# import time; a process that changes identity afterwards keeps the
+# paths it imported with
 _EFFECTIVE_UID = _get_effective_uid()
 
-# Base paths for Mini-Docker
-# Determine the root directory for storage
-if os.environ.get("MINI_DOCKER_ROOT"):
-    MINI_DOCKER_ROOT = os.environ["MINI_DOCKER_ROOT"]
-elif _EFFECTIVE_UID == 0:
-    MINI_DOCKER_ROOT = "/var/lib/mini-docker"
-else:
-    # Use standard XDG data home for rootless mode
-    xdg_data = os.environ.get("XDG_DATA_HOME", os.path.expanduser("~/.local/share"))
-    MINI_DOCKER_ROOT = os.path.join(xdg_data, "mini-docker")
+# Base paths for Mini-Docker, each a single expression: the explicit
+# environment override wins, root uses the system locations, and
+# rootless mode falls back to the XDG directories. Empty environment
+# values count as unset, per the XDG spec
+_xdg_data = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+MINI_DOCKER_ROOT = os.environ.get("MINI_DOCKER_ROOT") or (
+    "/var/lib/mini-docker"
+    if _EFFECTIVE_UID == 0
+    else f"{_xdg_data}/mini-docker"
+)
 
 CONTAINERS_PATH = f"{MINI_DOCKER_ROOT}/containers"
 IMAGES_PATH = f"{MINI_DOCKER_ROOT}/images"
 OVERLAY_PATH = f"{MINI_DOCKER_ROOT}/overlay"
 PODS_PATH = f"{MINI_DOCKER_ROOT}/pods"
 
-# Determine run directory (for PIDs, sockets)
-if os.environ.get("MINI_DOCKER_RUN"):
-    RUN_PATH = os.environ["MINI_DOCKER_RUN"]
-elif _EFFECTIVE_UID == 0:
-    RUN_PATH = "/var/run/mini-docker"
-else:
-    # Use standard XDG runtime dir
-    xdg_runtime = os.environ.get("XDG_RUNTIME_DIR")
-    if xdg_runtime:
-        RUN_PATH = os.path.join(xdg_runtime, "mini-docker")
-    else:
-        # Fallback to a temp directory that also works on non-Linux hosts.
-        suffix = str(_EFFECTIVE_UID) if _EFFECTIVE_UID is not None else "user"
-        RUN_PATH = os.path.join(tempfile.gettempdir(), f"mini-docker-{suffix}")
+# Run directory (for PIDs, sockets); the last fallback is a temp
+# directory that also works on non-Linux hosts
+_xdg_runtime = os.environ.get("XDG_RUNTIME_DIR")
+_uid_suffix = str(_EFFECTIVE_UID) if _EFFECTIVE_UID is not None else "user"
+RUN_PATH = os.environ.get("MINI_DOCKER_RUN") or (
+    "/var/run/mini-docker"
+    if _EFFECTIVE_UID == 0
+    else (
+        f"{_xdg_runtime}/mini-docker"
+        if _xdg_runtime
+        else os.path.join(tempfile.gettempdir(), f"mini-docker-{_uid_suffix}")
+    )
+)
 
 DEFAULT_SOCKET_PATH = os.path.join(RUN_PATH, "mini-docker.sock")
 
-# Adjectives for Docker-style names
-ADJECTIVES = [
+# Adjectives for Docker-style names (tuple: immutable, and indexing
+# skips the list-mutation guard random.choice pays on lists)
+ADJECTIVES = (
     "admiring",
     "adoring",
     "affectionate",
@@ -210,10 +216,10 @@ ADJECTIVES = [
     "zen",
     "silent",
     "swift",
-]
+)
 
 # Animals for Docker-style names
-ANIMALS = [
+ANIMALS = (
     "albatross",
     "alligator",
     "alpaca",
@@ -353,7 +359,13 @@ ANIMALS = [
     "woodpecker",
     "yak",
     "zebra",
-]
+)
+
+# Bound once so the ID, name, and MAC generators skip the per-call
+# module-attribute lookups
+_choice = random.choice
+_choices = random.choices
+_urandom = os.urandom
 
 
 def generate_container_id() -> str:
@@ -362,9 +374,8 @@ def generate_container_id() -> str:
     Similar to Docker's short container IDs.
 
     Algorithm:
-        1. Use secure random selection from hex character set [0-9a-f]
-        2. Generate exactly 12 characters
-        3. Result is lowercase for consistency
+        1. Read 6 bytes from the kernel CSPRNG (one getrandom call)
+        2. Hex-encode them in C to exactly 12 lowercase characters
 
     Returns:
         str: 12-char hex string (e.g., "a1b2c3d4e5f6")
@@ -377,7 +388,7 @@ def generate_container_id() -> str:
         >>> len(generate_container_id())
         12
     """
-    return secrets.token_hex(6)
+    return _urandom(6).hex()
 
 
 def generate_container_name() -> str:
@@ -401,15 +412,70 @@ def generate_container_name() -> str:
         >>> '-' in generate_container_name()
         True
     """
-    adjective = random.choice(ADJECTIVES)
-    animal = random.choice(ANIMALS)
-    return f"{adjective}-{animal}"
+    return f"{_choice(ADJECTIVES)}-{_choice(ANIMALS)}"
+
+
+def generate_container_names(n: int) -> list:
+    """
+    Generate n Docker-style random names in one batch.
+
+    random.choices draws all n picks per word list in a single C-level
+    loop over the generator state, so provisioning many containers at
+    once (pod bring-up, bulk create) pays Python call dispatch once
+    per list instead of once per name. Names may repeat, same as
+    repeated generate_container_name calls.
+
+    Args:
+        n: Number of names to generate
+
+    Returns:
+        List of n "adjective-animal" names
+    """
+    adjectives = _choices(ADJECTIVES, k=n)
+    animals = _choices(ANIMALS, k=n)
+    return [f"{a}-{b}" for a, b in zip(adjectives, animals)]
+
+
+def generate_unique_names(existing: Set[str], n: int) -> List[str]:
+    """
+    Generate n random names that collide neither with existing names
+    nor with each other.
+
+    Shuffles the full adjective-animal pool once (a single
+    Fisher-Yates pass in C over ~13,800 combinations) and takes the
+    first n free names. Rejection sampling - draw, check, redraw -
+    degrades badly as the namespace fills up; the shuffle costs the
+    same no matter how crowded it is.
+
+    Args:
+        existing: Names already taken
+        n: Number of fresh names needed
+
+    Returns:
+        List of n unique "adjective-animal" names
+
+    Raises:
+        RuntimeError: If fewer than n names remain in the pool
+    """
+    pool = [f"{a}-{b}" for a in ADJECTIVES for b in ANIMALS]
+    random.shuffle(pool)
+    names = []
+    for name in pool:
+        if name in existing:
+            continue
+        names.append(name)
+        if len(names) == n:
+            return names
+    raise RuntimeError("container name pool exhausted")
 
 
 def ensure_directories():
     """Create all required Mini-Docker directories."""
+    # The storage directories all live under MINI_DOCKER_ROOT and
+    # makedirs creates missing ancestors, so the root needs no call
+    # of its own. RUN_PATH may sit under a different root (XDG
+    # runtime dir or /tmp) and keeps its explicit entry
     directories = [
-        MINI_DOCKER_ROOT,
         CONTAINERS_PATH,
         IMAGES_PATH,
         OVERLAY_PATH,
@@ -422,7 +488,13 @@ def ensure_directories():
 
 def get_container_path(container_id: str) -> str:
     """Get the path to a container's directory."""
-    return os.path.join(CONTAINERS_PATH, container_id)
+    # The base paths are absolute module constants on a Linux-only
+    # runtime, so plain f-string joins skip os.path.join's separator
+    # and absoluteness handling on this hot lookup path. The constant
+    # is read live on purpose: callers (and the test suite) point
+    # CONTAINERS_PATH at scratch roots, so a prefix snapshotted at
+    # import would go stale
+    return f"{CONTAINERS_PATH}/{container_id}"
 
 
 def get_overlay_paths(container_id: str) -> Tuple[str, str, str, str]:
@@ -432,12 +504,12 @@ def get_overlay_paths(container_id: str) -> Tuple[str, str, str, str]:
     Returns:
         Tuple of (lower, upper, work, merged) paths
     """
-    base = os.path.join(OVERLAY_PATH, container_id)
+    base = f"{OVERLAY_PATH}/{container_id}"
     return (
-        os.path.join(base, "lower"),
-        os.path.join(base, "upper"),
-        os.path.join(base, "work"),
-        os.path.join(base, "merged"),
+        f"{base}/lower",
+        f"{base}/upper",
+        f"{base}/work",
+        f"{base}/merged",
     )
 
 
@@ -453,10 +525,24 @@ except OSError:
     else:
         libc = ctypes.CDLL("", use_errno=True)
 
+# ctypes resolves a symbol once on first attribute access and caches
+# the function object on the handle, and each consumer module declares
+# argtypes/restype for its own libc entry points at import. syscall(2)
+# is the shared variadic escape hatch with no natural home, so declare
+# its return width here - the default c_int would truncate 64-bit
+# returns - which also front-loads the dlsym out of container paths
+try:
+    libc.syscall.restype = ctypes.c_long
+except AttributeError:
+    # msvcrt has no syscall(); the Linux-only callers never run there
+    pass
+
 
 def check_root() -> bool:
     """Check if running as root."""
-    return _EFFECTIVE_UID == 0
+    # Queried live rather than from the import-time sample: privilege
+    # checks must see seteuid changes made after import
+    return _get_effective_uid() == 0
 
 
 def is_process_alive(pid: Optional[int]) -> bool:
@@ -489,59 +575,162 @@ def is_process_alive(pid: Optional[int]) -> bool:
 
 def read_file(path: str) -> Optional[str]:
     """Safely read a file's contents."""
+    # Raw fd path: open() would build a three-object io stack
+    # (FileIO, BufferedReader, TextIOWrapper) that outweighs the read
+    # itself for the small /proc and cgroup files this serves
     try:
-        with open(path, "r") as f:
-            return f.read().strip()
-    except (IOError, OSError):
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
+        return None
+    chunks = []
+    try:
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except OSError:
         return None
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode("utf-8", "replace").strip()
 
 
 def write_file(path: str, content: str) -> bool:
     """Safely write content to a file."""
+    # Raw fd path, mirroring read_file. Beyond skipping the io stack,
+    # this guarantees the payload reaches the kernel in one write(2):
+    # cgroupfs interprets each write call as a complete value, which
+    # text-mode buffering is free to fragment
+    if isinstance(content, str):
+        content = content.encode("utf-8")
     try:
-        with open(path, "w") as f:
-            f.write(content)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+    except OSError:
+        return False
+    try:
+        os.write(fd, content)
         return True
-    except (IOError, OSError):
+    except OSError:
         return False
+    finally:
+        os.close(fd)
+
+
+# Seeding the bitmap only needs network.ip out of each config, so a
+# byte-level scan pulls the host octet without decoding or building
+# the dicts and lists for every other field; json.loads stays as the
+# fallback for configs the pattern does not recognize
+_CONFIG_IP_RE = re.compile(rb'"network"\s*:\s*\{[^}]*?"ip"\s*:\s*"10\.0\.0\.(\d{1,3})"')
+
+# Allocation bitmap for the 10.0.0.0/24 range: one bit per host octet,
+# seeded from the on-disk container configs once per process and kept
+# in memory afterwards, so repeat allocations never rescan the configs
+_ip_lock = threading.Lock()
+_ip_bitmap: Optional[bytearray] = None
+
+
+def _seed_ip_bitmap() -> bytearray:
+    """Build the allocation bitmap from existing container configs."""
+    bitmap = bytearray(32)
+
+    def _mark(index: int) -> None:
+        bitmap[index >> 3] |= 1 << (index & 7)
+
+    # Network address, gateway, and broadcast are never handed out
+    _mark(0)
+    _mark(1)
+    _mark(255)
+
+    # scandir hands back each entry's type from the directory read
+    # itself, and opening config.json directly instead of stat-ing it
+    # first drops two stat syscalls per container
+    try:
+        entries = os.scandir(CONTAINERS_PATH)
+    except OSError:
+        return bitmap
+
+    with entries:
+        for entry in entries:
+            try:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+            try:
+                with open(os.path.join(entry.path, "config.json"), "rb") as f:
+                    raw = f.read()
+            except OSError:
+                continue
+            match = _CONFIG_IP_RE.search(raw)
+            if match is not None:
+                _mark(int(match.group(1)))
+                continue
+            try:
+                config = json.loads(raw)
+                ip = config.get("network", {}).get("ip")
+                if ip and ip.startswith("10.0.0."):
+                    _mark(int(ip.rsplit(".", 1)[1]))
+            except (
+                json.JSONDecodeError,
+                UnicodeDecodeError,
+                KeyError,
+                TypeError,
+                ValueError,
+            ):
+                pass
+
+    return bitmap
 
 
 def get_available_ip() -> str:
     """
     Get an available IP address in the 10.0.0.0/24 range.
-    Checks existing containers to avoid conflicts.
+
+    Allocates the lowest free host octet from a bitmap: four 64-bit
+    word scans worst case, with the lowest zero bit isolated
+    arithmetically instead of looping per address. The bitmap is the
+    dense equivalent of a precomputed candidate set - the full
+    10.0.0.2-254 pool lives in 32 bytes, seeded from disk once per
+    process - and allocation order is deterministic (always the lowest
+    free address). Thread-safe for concurrent container setup.
     """
-    used_ips = set()
-
-    # Scan existing containers for used IPs
-    if os.path.exists(CONTAINERS_PATH):
-        for cid in os.listdir(CONTAINERS_PATH):
-            config_path = os.path.join(CONTAINERS_PATH, cid, "config.json")
-            if os.path.exists(config_path):
-                try:
-                    import json
-
-                    with open(config_path) as f:
-                        config = json.load(f)
-                        if "network" in config and "ip" in config["network"]:
-                            ip = config["network"]["ip"]
-                            if ip:
-                                used_ips.add(ip)
-                except (json.JSONDecodeError, IOError, OSError, KeyError, TypeError):
-                    pass
-
-    # Find available IP (10.0.0.2 - 10.0.0.254)
-    for i in range(2, 255):
-        ip = f"10.0.0.{i}"
-        if ip not in used_ips:
-            return ip
+    global _ip_bitmap
+    with _ip_lock:
+        if _ip_bitmap is None:
+            _ip_bitmap = _seed_ip_bitmap()
+
+        for offset in range(0, 32, 8):
+            word = int.from_bytes(_ip_bitmap[offset : offset + 8], "little")
+            free = ~word & 0xFFFFFFFFFFFFFFFF
+            if free:
+                bit = (free & -free).bit_length() - 1
+                word |= 1 << bit
+                _ip_bitmap[offset : offset + 8] = word.to_bytes(8, "little")
+                return f"10.0.0.{offset * 8 + bit}"
 
     raise RuntimeError("No available IP addresses in 10.0.0.0/24 range")
 
 
+def release_ip(ip: str) -> None:
+    """Return a previously allocated 10.0.0.0/24 address to the pool."""
+    if not ip.startswith("10.0.0."):
+        return
+    try:
+        index = int(ip.rsplit(".", 1)[1])
+    except ValueError:
+        return
+    if index in (0, 1, 255) or not 0 <= index <= 255:
+        return
+    with _ip_lock:
+        if _ip_bitmap is not None:
+            _ip_bitmap[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+
 def generate_mac_address() -> str:
     """Generate a random MAC address with local bit set."""
-    # First byte: set local bit (0x02) and clear multicast bit
-    mac = [0x02, 0x42]  # 02:42 is Docker's prefix
-    mac.extend([random.randint(0, 255) for _ in range(4)])
-    return ":".join(f"{b:02x}" for b in mac)
+    # First bytes 02:42 are Docker's prefix: local bit (0x02) set,
+    # multicast bit clear. One getrandom call plus a C-level hex
+    # encode covers the four random tail bytes
+    tail = _urandom(4).hex()
+    return f"02:42:{tail[0:2]}:{tail[2:4]}:{tail[4:6]}:{tail[6:8]}"
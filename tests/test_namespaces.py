@@ -105,6 +105,39 @@ class TestNamespaceFunctions:
         namespaces.enter_all_namespaces(1234, ["pid", "net"])
         assert mock_enter.call_count == 2
 
+    @mock.patch("os.close")
+    @mock.patch("os.pidfd_open", create=True)
+    def test_enter_namespaces_pidfd(self, mock_pidfd_open, mock_close, mock_libc):
+        mock_pidfd_open.return_value = 42
+
+        namespaces.enter_namespaces_pidfd(1234, ["pid", "net"])
+
+        mock_pidfd_open.assert_called_once_with(1234, 0)
+        mock_libc.setns.assert_called_once_with(
+            42, namespaces.CLONE_NEWPID | namespaces.CLONE_NEWNET
+        )
+        mock_close.assert_called_once_with(42)
+
+    @mock.patch("os.pidfd_open", create=True)
+    def test_enter_namespaces_pidfd_open_failure(self, mock_pidfd_open):
+        mock_pidfd_open.side_effect = ProcessLookupError()
+        with pytest.raises(NamespaceError, match="pidfd_open"):
+            namespaces.enter_namespaces_pidfd(1234, ["pid"])
+
+    @mock.patch("os.close")
+    @mock.patch("os.pidfd_open", create=True)
+    def test_enter_namespaces_pidfd_setns_failure(
+        self, mock_pidfd_open, mock_close, mock_libc, mock_ctypes
+    ):
+        mock_pidfd_open.return_value = 42
+        mock_libc.setns.return_value = -1
+
+        with pytest.raises(NamespaceError, match="setns failed"):
+            namespaces.enter_namespaces_pidfd(1234, ["pid"])
+
+        # The pidfd must not leak on failure
+        mock_close.assert_called_once_with(42)
+
     @mock.patch("os.readlink")
     def test_get_namespace_id(self, mock_readlink):
         mock_readlink.return_value = "pid:[12345]"
@@ -1,3 +1,4 @@
+import asyncio
 import subprocess
 
 import pytest
@@ -15,89 +16,103 @@ def test_parse_port_mapping_rejects_invalid_mapping(mapping):
         network.parse_port_mapping(mapping)
 
 
-def test_setup_nat_adds_missing_masquerade_rule(monkeypatch):
-    calls = []
+def test_setup_nat_prefers_single_nft_transaction(monkeypatch):
+    rulesets = []
 
-    def fake_iptables(args, check=True):
-        calls.append((args, check))
-        if "-C" in args:
-            return subprocess.CompletedProcess(["iptables"] + args, 1)
-        return subprocess.CompletedProcess(["iptables"] + args, 0)
+    monkeypatch.setattr("mini_docker.network._nat_ready", False)
+    monkeypatch.setattr("mini_docker.network._nft_supported", lambda: True)
+    monkeypatch.setattr(
+        "mini_docker.network.run_nft", lambda ruleset: rulesets.append(ruleset)
+    )
 
-    monkeypatch.setattr("mini_docker.network.run_iptables_command", fake_iptables)
+    def fail_restore(rules):
+        raise AssertionError("iptables path should not run when nft works")
+
+    monkeypatch.setattr("mini_docker.network.run_iptables_restore", fail_restore)
 
     network.setup_nat("10.0.0.0/24")
 
-    assert calls == [
-        (
-            ["-t", "nat", "-C", "POSTROUTING", "-s", "10.0.0.0/24", "-j", "MASQUERADE"],
-            False,
-        ),
-        (
-            ["-t", "nat", "-A", "POSTROUTING", "-s", "10.0.0.0/24", "-j", "MASQUERADE"],
-            True,
-        ),
-        (
-            [
-                "-t",
-                "nat",
-                "-C",
-                "POSTROUTING",
-                "-o",
-                "mini-docker0",
-                "-j",
-                "MASQUERADE",
-            ],
-            False,
-        ),
-        (
-            [
-                "-t",
-                "nat",
-                "-A",
-                "POSTROUTING",
-                "-o",
-                "mini-docker0",
-                "-j",
-                "MASQUERADE",
-            ],
-            True,
-        ),
-    ]
+    assert len(rulesets) == 1
+    assert "ip saddr 10.0.0.0/24 masquerade" in rulesets[0]
+    assert 'oifname "mini-docker0" masquerade' in rulesets[0]
 
 
-def test_setup_nat_does_not_add_existing_masquerade_rule(monkeypatch):
-    calls = []
+def test_setup_nat_restores_missing_masquerade_rules_in_one_batch(monkeypatch):
+    restored = []
 
-    def fake_iptables(args, check=True):
-        calls.append((args, check))
-        return subprocess.CompletedProcess(["iptables"] + args, 0)
+    monkeypatch.setattr("mini_docker.network._nat_ready", False)
+    monkeypatch.setattr("mini_docker.network._nft_supported", lambda: False)
+    monkeypatch.setattr("mini_docker.network._existing_nat_rules", lambda: "")
+    monkeypatch.setattr(
+        "mini_docker.network.run_iptables_restore",
+        lambda rules: restored.append(rules),
+    )
 
-    monkeypatch.setattr("mini_docker.network.run_iptables_command", fake_iptables)
+    network.setup_nat("10.0.0.0/24")
+
+    assert restored == [
+        "*nat\n"
+        "-A POSTROUTING -s 10.0.0.0/24 -j MASQUERADE\n"
+        "-A POSTROUTING -o mini-docker0 -j MASQUERADE\n"
+        "COMMIT\n"
+    ]
+
+
+def test_setup_nat_only_restores_missing_masquerade_rules(monkeypatch):
+    restored = []
+
+    monkeypatch.setattr("mini_docker.network._nat_ready", False)
+    monkeypatch.setattr("mini_docker.network._nft_supported", lambda: False)
+    monkeypatch.setattr(
+        "mini_docker.network._existing_nat_rules",
+        lambda: "-A POSTROUTING -s 10.0.0.0/24 -j MASQUERADE\n",
+    )
+    monkeypatch.setattr(
+        "mini_docker.network.run_iptables_restore",
+        lambda rules: restored.append(rules),
+    )
 
     network.setup_nat("10.0.0.0/24")
 
-    assert calls == [
-        (
-            ["-t", "nat", "-C", "POSTROUTING", "-s", "10.0.0.0/24", "-j", "MASQUERADE"],
-            False,
-        ),
-        (
-            [
-                "-t",
-                "nat",
-                "-C",
-                "POSTROUTING",
-                "-o",
-                "mini-docker0",
-                "-j",
-                "MASQUERADE",
-            ],
-            False,
-        ),
+    assert restored == [
+        "*nat\n-A POSTROUTING -o mini-docker0 -j MASQUERADE\nCOMMIT\n"
     ]
 
 
+def test_setup_nat_skips_restore_when_rules_exist(monkeypatch):
+    monkeypatch.setattr("mini_docker.network._nat_ready", False)
+    monkeypatch.setattr("mini_docker.network._nft_supported", lambda: False)
+    monkeypatch.setattr(
+        "mini_docker.network._existing_nat_rules",
+        lambda: (
+            "-A POSTROUTING -s 10.0.0.0/24 -j MASQUERADE\n"
+            "-A POSTROUTING -o mini-docker0 -j MASQUERADE\n"
+        ),
+    )
+
+    def fail_restore(rules):
+        raise AssertionError("restore should not run when rules exist")
+
+    monkeypatch.setattr("mini_docker.network.run_iptables_restore", fail_restore)
+
+    network.setup_nat("10.0.0.0/24")
+
+
+def test_setup_nat_is_cached_after_first_success(monkeypatch):
+    rulesets = []
+
+    monkeypatch.setattr("mini_docker.network._nat_ready", False)
+    monkeypatch.setattr("mini_docker.network._nft_supported", lambda: True)
+    monkeypatch.setattr(
+        "mini_docker.network.run_nft", lambda ruleset: rulesets.append(ruleset)
+    )
+
+    network.setup_nat("10.0.0.0/24")
+    network.setup_nat("10.0.0.0/24")
+
+    assert len(rulesets) == 1
+
+
 def test_setup_port_forwarding_raises_on_iptables_failure(monkeypatch):
     def fail_run(*args, **kwargs):
         raise subprocess.CalledProcessError(1, args[0], stderr=b"iptables failed")
@@ -138,3 +153,25 @@ def test_remove_nat_uses_non_failing_delete(monkeypatch):
             False,
         ),
     ]
+
+
+def test_setup_container_networking_async_runs_concurrently(monkeypatch):
+    def fake_setup(container_id, container_pid, ip_address=None):
+        return (f"veth{container_id}", "eth0", "10.0.0.2")
+
+    monkeypatch.setattr(
+        "mini_docker.network.setup_container_networking", fake_setup
+    )
+
+    async def launch_batch():
+        return await asyncio.gather(
+            network.setup_container_networking_async("aaaa", 100),
+            network.setup_container_networking_async("bbbb", 101),
+        )
+
+    results = asyncio.run(launch_batch())
+
+    assert results == [
+        ("vethaaaa", "eth0", "10.0.0.2"),
+        ("vethbbbb", "eth0", "10.0.0.2"),
+    ]